@@ -1,18 +1,28 @@
-import math
 import os
+from typing import Optional
+
 import pandas as pd
 from models import Resort
 
 RESORTS_CSV = os.path.join(os.path.dirname(__file__), '..', 'data', 'resorts.csv')
 
 
-def load_resorts() -> list[Resort]:
-    df = pd.read_csv(RESORTS_CSV, na_values=[''], keep_default_na=False)
-    df = df.where(pd.notna(df), other=None)
-    records = df.to_dict(orient='records')
-    # pandas represents missing floats as float('nan') after to_dict; convert to None
-    cleaned = [
-        {k: None if isinstance(v, float) and math.isnan(v) else v for k, v in row.items()}
-        for row in records
-    ]
-    return [Resort(**row) for row in cleaned]
+def read_resorts_csv() -> pd.DataFrame:
+    # Only parse columns Resort actually declares; anything else the pipeline writes would
+    # be silently dropped by pydantic anyway
+    return pd.read_csv(
+        RESORTS_CSV,
+        usecols=lambda c: c in Resort.model_fields,
+        na_values=[''],
+        keep_default_na=False,
+    )
+
+
+def load_resorts(df: Optional[pd.DataFrame] = None) -> list[Resort]:
+    """Build Resort models from resorts.csv, or from an already-read frame of it."""
+    if df is None:
+        df = read_resorts_csv()
+    # Cast to object first so missing values become None in one vectorized pass — on
+    # float columns .where() would otherwise put NaN straight back.
+    records = df.astype(object).where(df.notna(), other=None).to_dict(orient='records')
+    return [Resort(**row) for row in records]
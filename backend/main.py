@@ -1,8 +1,9 @@
 import json
 import os
+from bisect import bisect_left
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Query
-from typing import Optional
+from typing import Callable, Optional
 
 from data import load_resorts
 from models import Resort, ResortSummary, MetaResponse, RangeField, DateRangeField
@@ -39,25 +40,39 @@ def health():
     return {"status": "ok"}
 
 
-def _parse_date_list(value: Optional[str]) -> set[str]:
-    """Parse a JSON-encoded date array from the CSV into a set of date strings."""
-    if not value:
-        return set()
-    try:
-        return set(json.loads(value))
-    except (json.JSONDecodeError, TypeError):
-        return set()
+def _any_date_in_range(dates: tuple[str, ...], lo: str, hi: str) -> bool:
+    """True if the sorted ISO date tuple has any date within [lo, hi]."""
+    i = bisect_left(dates, lo)
+    return i < len(dates) and dates[i] <= hi
+
+
+# /meta is derived entirely from the loaded dataset, so it's built once per
+# (_resorts, _last_pipeline_run) pair rather than rescanning every resort on each call
+_meta_cache: Optional[MetaResponse] = None
+_meta_cache_source: Optional[tuple[list[Resort], Optional[str]]] = None
 
 
 @app.get("/meta", response_model=MetaResponse)
 def get_meta():
+    global _meta_cache, _meta_cache_source
+    source = _meta_cache_source
+    if source is None or source[0] is not _resorts or source[1] != _last_pipeline_run:
+        _meta_cache = _build_meta()
+        _meta_cache_source = (_resorts, _last_pipeline_run)
+    return _meta_cache
+
+
+def _build_meta() -> MetaResponse:
     def _range(field: str) -> RangeField:
         vals = [v for r in _resorts if (v := getattr(r, field)) is not None]
         return RangeField(min=min(vals) if vals else None, max=max(vals) if vals else None)
 
     def _date_range(field: str) -> DateRangeField:
-        dates = {d for r in _resorts for d in _parse_date_list(getattr(r, field))}
-        return DateRangeField(min=min(dates) if dates else None, max=max(dates) if dates else None)
+        per_resort = [dates for r in _resorts if (dates := getattr(r, field))]
+        return DateRangeField(
+            min=min(d[0] for d in per_resort) if per_resort else None,
+            max=max(d[-1] for d in per_resort) if per_resort else None,
+        )
 
     return MetaResponse(
         last_pipeline_run=_last_pipeline_run,
@@ -93,17 +108,31 @@ def get_meta():
                 if tag and tag != 'Indy Pass'
             }
         ),
-        blackout_date_range=_date_range('blackout_all_dates'),
-        ltt_date_range=_date_range('ltt_blackout_all_dates'),
+        blackout_date_range=_date_range('blackout_dates'),
+        ltt_date_range=_date_range('ltt_blackout_dates'),
     )
 
 
+# resort_id -> Resort, rebuilt only when _resorts is swapped for a different list
+_resort_index: dict[str, Resort] = {}
+_resort_index_source: Optional[list[Resort]] = None
+
+
+def _get_resort_index() -> dict[str, Resort]:
+    global _resort_index, _resort_index_source
+    if _resort_index_source is not _resorts:
+        # reversed() so the first resort wins on a duplicate id, as the old linear scan did
+        _resort_index = {r.resort_id: r for r in reversed(_resorts)}
+        _resort_index_source = _resorts
+    return _resort_index
+
+
 @app.get("/resorts/{resort_id}", response_model=Resort)
 def get_resort(resort_id: str):
-    for r in _resorts:
-        if r.resort_id == resort_id:
-            return r
-    raise HTTPException(status_code=404, detail="Resort not found")
+    resort = _get_resort_index().get(resort_id)
+    if resort is None:
+        raise HTTPException(status_code=404, detail="Resort not found")
+    return resort
 
 
 @app.get("/resorts", response_model=list[ResortSummary])
@@ -173,30 +202,26 @@ def get_resorts(
     ltt_date_from: Optional[str] = Query(default=None),
     ltt_date_to: Optional[str] = Query(default=None),
 ):
-    results = _resorts
-
-    if search:
-        term = search.lower()
-        results = [
-            r
-            for r in results
-            if term in (r.name or '').lower()
-            or term in (r.city or '').lower()
-            or term in (r.state or '').lower()
-            or term in (r.country or '').lower()
-        ]
+    # Each supplied filter adds a predicate; resorts are then checked against all of them
+    # in a single pass instead of rebuilding the result list once per filter.
+    predicates: list[Callable[[Resort], bool]] = []
+
+    # Whitespace-only terms match everything, so skip the scan rather than run it
+    term = (search or '').strip().lower()
+    if term:
+        predicates.append(lambda r: any(term in f for f in r.search_fields))
 
     if region:
         region_set = {v.lower() for v in region}
-        results = [r for r in results if (r.region or '').lower() in region_set]
+        predicates.append(lambda r: r.region_key in region_set)
 
     if country:
         country_set = {v.lower() for v in country}
-        results = [r for r in results if (r.country or '').lower() in country_set]
+        predicates.append(lambda r: r.country_key in country_set)
 
     if state:
         state_set = {v.lower() for v in state}
-        results = [r for r in results if (r.state or '').lower() in state_set]
+        predicates.append(lambda r: r.state_key in state_set)
 
     # Boolean feature flags
     bool_filters = [
@@ -209,21 +234,17 @@ def get_resorts(
         ('is_allied', is_allied),
         ('ltt_available', ltt_available),
     ]
-    for field, value in bool_filters:
-        if value is not None:
-            results = [r for r in results if getattr(r, field) == value]
+    active_bools = [(field, value) for field, value in bool_filters if value is not None]
+    if active_bools:
+        predicates.append(
+            lambda r: all(getattr(r, field) == value for field, value in active_bools)
+        )
 
     if has_peak_rankings is not None:
-        if has_peak_rankings:
-            results = [r for r in results if r.pr_total is not None]
-        else:
-            results = [r for r in results if r.pr_total is None]
+        predicates.append(lambda r: (r.pr_total is not None) == has_peak_rankings)
 
     if reservation_required is not None:
-        if reservation_required:
-            results = [r for r in results if r.reservation_status == 'Required']
-        else:
-            results = [r for r in results if r.reservation_status != 'Required']
+        predicates.append(lambda r: (r.reservation_status == 'Required') == reservation_required)
 
     # Numeric range filters (resorts with null values are excluded)
     range_filters = [
@@ -245,15 +266,17 @@ def get_resorts(
         ('pr_navigation', pr_navigation_min, pr_navigation_max),
         ('pr_mountain_aesthetic', pr_mountain_aesthetic_min, pr_mountain_aesthetic_max),
     ]
-    for field, lo, hi in range_filters:
-        if lo is not None:
-            results = [
-                r for r in results if getattr(r, field) is not None and getattr(r, field) >= lo
-            ]
-        if hi is not None:
-            results = [
-                r for r in results if getattr(r, field) is not None and getattr(r, field) <= hi
-            ]
+    active_ranges = [(f, lo, hi) for f, lo, hi in range_filters if lo is not None or hi is not None]
+
+    def _in_ranges(r: Resort) -> bool:
+        for field, lo, hi in active_ranges:
+            v = getattr(r, field)
+            if v is None or (lo is not None and v < lo) or (hi is not None and v > hi):
+                return False
+        return True
+
+    if active_ranges:
+        predicates.append(_in_ranges)
 
     # Peak Rankings categorical multi-value filters
     categorical_filters = [
@@ -266,43 +289,38 @@ def get_resorts(
     for field, values in categorical_filters:
         if values:
             value_set = {v.lower() for v in values}
-            results = [r for r in results if (getattr(r, field) or '').lower() in value_set]
+            predicates.append(
+                lambda r, field=field, value_set=value_set: (getattr(r, field) or '').lower()
+                in value_set
+            )
 
     # pr_pass_affiliation holds comma-separated combos (e.g. "Cali Pass, Powder Alliance"),
     # not single tags, so this any-matches selected tags against each resort's split combo
     # rather than treating the whole string as one opaque value like the filters above.
     if pass_affiliation:
         affiliation_set = {v.lower() for v in pass_affiliation}
-        results = [
-            r
-            for r in results
-            if {t.strip().lower() for t in (r.pr_pass_affiliation or '').split(',')}
-            & affiliation_set
-        ]
+        predicates.append(
+            lambda r: bool(
+                {t.strip().lower() for t in (r.pr_pass_affiliation or '').split(',')}
+                & affiliation_set
+            )
+        )
 
     if has_blackouts is not None:
-        if has_blackouts:
-            results = [r for r in results if (r.blackout_count or 0) > 0]
-        else:
-            results = [r for r in results if (r.blackout_count or 0) == 0]
+        predicates.append(lambda r: ((r.blackout_count or 0) > 0) == has_blackouts)
 
     # Blackout date range filters — exclude resorts with any blackout within [from, to]
     if blackout_date_from or blackout_date_to:
-        lo = blackout_date_from or '0000-01-01'
-        hi = blackout_date_to or '9999-12-31'
-        results = [
-            r
-            for r in results
-            if not any(lo <= d <= hi for d in _parse_date_list(r.blackout_all_dates))
-        ]
+        blackout_lo = blackout_date_from or '0000-01-01'
+        blackout_hi = blackout_date_to or '9999-12-31'
+        predicates.append(
+            lambda r: not _any_date_in_range(r.blackout_dates, blackout_lo, blackout_hi)
+        )
 
     if ltt_date_from or ltt_date_to:
-        lo = ltt_date_from or '0000-01-01'
-        hi = ltt_date_to or '9999-12-31'
-        results = [
-            r
-            for r in results
-            if not any(lo <= d <= hi for d in _parse_date_list(r.ltt_blackout_all_dates))
-        ]
-
-    return [ResortSummary(**r.model_dump()) for r in results]
+        ltt_lo = ltt_date_from or '0000-01-01'
+        ltt_hi = ltt_date_to or '9999-12-31'
+        predicates.append(lambda r: not _any_date_in_range(r.ltt_blackout_dates, ltt_lo, ltt_hi))
+
+    results = [r for r in _resorts if all(p(r) for p in predicates)]
+    return [r.summary for r in results]
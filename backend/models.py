@@ -1,5 +1,7 @@
+import json
 import logging
 import re
+from functools import cached_property
 from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
@@ -79,6 +81,16 @@ def _null_if_bad_url(value, field_name, resort_id):
     return value
 
 
+def _parse_date_list(value: Optional[str]) -> tuple[str, ...]:
+    """Parse a JSON-encoded date array from the CSV into a sorted tuple of date strings."""
+    if not value:
+        return ()
+    try:
+        return tuple(sorted(set(json.loads(value))))
+    except (json.JSONDecodeError, TypeError):
+        return ()
+
+
 class RangeField(BaseModel):
     min: Optional[float] = None
     max: Optional[float] = None
@@ -181,6 +193,11 @@ class ResortSummary(BaseModel):
     pr_pass_affiliation: Optional[str] = None
 
 
+# Only the columns ResortSummary ships — dumping the full Resort (descriptions, raw
+# blackout JSON, *_display strings) just to have pydantic discard them again is wasted work.
+_SUMMARY_FIELDS = frozenset(ResortSummary.model_fields)
+
+
 class Resort(BaseModel):
     resort_id: str
     name: str
@@ -255,6 +272,41 @@ class Resort(BaseModel):
     pr_nearest_cities: Optional[str] = None
     pr_pass_affiliation: Optional[str] = None
 
+    # Derived once per resort rather than on every request. cached_property values
+    # aren't model fields, so they stay out of model_dump().
+    @cached_property
+    def summary(self) -> ResortSummary:
+        """This resort's GET /resorts projection, built on first use and reused after."""
+        return ResortSummary(**self.model_dump(include=_SUMMARY_FIELDS))
+
+    @cached_property
+    def search_fields(self) -> tuple[str, ...]:
+        """Lowercased name/city/state/country matched by the /resorts search term."""
+        return tuple((v or '').lower() for v in (self.name, self.city, self.state, self.country))
+
+    @cached_property
+    def region_key(self) -> str:
+        """Lowercased region matched by the /resorts region filter."""
+        return (self.region or '').lower()
+
+    @cached_property
+    def country_key(self) -> str:
+        """Lowercased country matched by the /resorts country filter."""
+        return (self.country or '').lower()
+
+    @cached_property
+    def state_key(self) -> str:
+        """Lowercased state matched by the /resorts state filter."""
+        return (self.state or '').lower()
+
+    @cached_property
+    def blackout_dates(self) -> tuple[str, ...]:
+        return _parse_date_list(self.blackout_all_dates)
+
+    @cached_property
+    def ltt_blackout_dates(self) -> tuple[str, ...]:
+        return _parse_date_list(self.ltt_blackout_all_dates)
+
     @field_validator(*_NONNEG_BOUNDS.keys(), mode='after')
     @classmethod
     def _validate_nonneg_bounded(cls, v, info):
@@ -200,3 +200,10 @@ def test_load_pipeline_metadata_missing_key():
         json.dump({'mode': 'full'}, f)
         path = f.name
     assert _load_pipeline_metadata(path) is None
+
+
+def test_meta_follows_reloaded_resorts():
+    with patch('main._resorts', FAKE_RESORTS):
+        assert client.get('/meta').json()['regions']
+    with patch('main._resorts', []):
+        assert client.get('/meta').json()['regions'] == []
@@ -57,3 +57,11 @@ def test_get_resort_by_id_not_found():
     with patch('main._resorts', FAKE_RESORTS):
         response = client.get('/resorts/nonexistent-uuid')
     assert response.status_code == 404
+
+
+def test_get_resort_by_id_follows_reloaded_resorts():
+    with patch('main._resorts', FAKE_RESORTS):
+        assert client.get('/resorts/abc-123').status_code == 200
+    with patch('main._resorts', FAKE_RESORTS[1:]):
+        assert client.get('/resorts/abc-123').status_code == 404
+        assert client.get('/resorts/def-456').status_code == 200
@@ -102,6 +102,18 @@ def test_search_is_case_insensitive(client):
     assert len(response.json()) == 1
 
 
+def test_search_ignores_surrounding_whitespace(client):
+    response = client.get('/resorts?search=%20stowe%20')
+    assert response.status_code == 200
+    assert [r['name'] for r in response.json()] == ['Stowe']
+
+
+def test_search_whitespace_only_returns_all(client):
+    response = client.get('/resorts?search=%20%20')
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+
+
 def test_filter_single_region(client):
     response = client.get('/resorts?region=West')
     assert response.status_code == 200
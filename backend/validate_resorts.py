@@ -22,7 +22,7 @@ from dataclasses import dataclass, field
 
 import pandas as pd
 
-from data import RESORTS_CSV, load_resorts
+from data import load_resorts, read_resorts_csv
 from models import Resort
 
 REPORTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'reports')
@@ -65,7 +65,7 @@ def check_expected_columns(df: pd.DataFrame) -> str | None:
 
 
 def run_validation() -> ValidationResult:
-    df = pd.read_csv(RESORTS_CSV, na_values=[''], keep_default_na=False)
+    df = read_resorts_csv()
     errors = [e for e in (check_row_count(df), check_expected_columns(df)) if e]
 
     handler = _WarningCapture()
@@ -73,7 +73,7 @@ def run_validation() -> ValidationResult:
     logger.addHandler(handler)
     resorts = []
     try:
-        resorts = load_resorts()
+        resorts = load_resorts(df)
     except Exception as e:
         errors.append(f'load_resorts() raised {type(e).__name__}: {e}')
     finally:
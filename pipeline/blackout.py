@@ -21,6 +21,9 @@ import json
 import logging
 import os
 import re
+from datetime import date
+from functools import lru_cache
+from io import StringIO
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
@@ -28,6 +31,7 @@ import pandas as pd
 try:
     from src.utils import (
         convert_date_string_format,
+        fetch_text_if_modified,
         filter_dates_for_weekday,
         get_all_dates_in_range,
         split_date_range,
@@ -35,6 +39,7 @@ try:
 except ModuleNotFoundError:
     from utils import (
         convert_date_string_format,
+        fetch_text_if_modified,
         filter_dates_for_weekday,
         get_all_dates_in_range,
         split_date_range,
@@ -44,8 +49,17 @@ except ModuleNotFoundError:
 # BLACKOUT_DATE_GSHEET_URL = 'https://docs.google.com/spreadsheets/d/e/2PACX-1vTUXA5uhe2QwuQvCTpaSpIQmNNWIAp4gADGo5DIUeDwMOfgg9a8nEMU2K_4J9_24E2dGaLgbBnplpqg/pub?gid=1371665852&single=true&output=csv'
 BLACKOUT_DATE_GSHEET_URL = 'https://docs.google.com/spreadsheets/d/e/2PACX-1vTUXA5uhe2QwuQvCTpaSpIQmNNWIAp4gADGo5DIUeDwMOfgg9a8nEMU2K_4J9_24E2dGaLgbBnplpqg/pub?gid=1762546441&single=true&output=csv'
 
+# Last downloaded blackout sheet CSV and its HTTP validators (.meta.json)
+BLACKOUT_SHEET_HTTP_CACHE = 'cache/blackout_dates_sheet.csv'
+
 logger = logging.getLogger(__name__)
 
+_NUMERIC_RANGE_RE = re.compile(
+    r'^(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\s*-\s*(\d{1,2}/\d{1,2}(?:/\d{2,4})?)$'
+)
+_MONTH_RE = re.compile(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b')
+_WEEKEND_RE = re.compile(r'weekend|saturday|sunday', re.IGNORECASE)
+
 
 BLACKOUT_RESORT_NAME_MAP = {
     '49° North': '49 Degrees North',
@@ -101,14 +115,28 @@ def get_blackout_dates_from_google_sheets(
 
     if read_mode == 'cache' and os.path.exists(cache_path):
         logger.info('Loading blackout dates from cached CSV file: %s', cache_path)
-        return pd.read_csv(cache_path)
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return _read_blackout_csv(f.read())
 
     logger.info('Fetching blackout dates from Google Sheets URL: %s', url)
-    return pd.read_csv(url)
+    csv_text = fetch_text_if_modified(url, BLACKOUT_SHEET_HTTP_CACHE)
+    return _read_blackout_csv(csv_text)
+
+
+def _read_blackout_csv(csv_text: str) -> pd.DataFrame:
+    """Parse blackout sheet CSV text as the raw sheet, every column kept.
+
+    Every cell is a flag or free text, so values are read as strings with no type inference.
+    Column headers are left exactly as in the sheet; the parsers normalize them.
+    """
+    return pd.read_csv(StringIO(csv_text), dtype=str)
 
 
 def _normalize_blackout_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Normalize blackout sheet columns, ensuring the resort column is named 'Resort'."""
+    """Normalize blackout sheet columns, ensuring the resort column is named 'Resort'.
+
+    Frames that are already normalized are returned as-is rather than copied again.
+    """
     normalized = []
     for col in df.columns:
         col_str = '' if col is None else str(col).strip()
@@ -116,15 +144,35 @@ def _normalize_blackout_columns(df: pd.DataFrame) -> pd.DataFrame:
             normalized.append('Resort')
         else:
             normalized.append(col_str)
-    out = df.copy()
+    if normalized == list(df.columns):
+        return df
+    out = df.copy(deep=False)  # labels only
     out.columns = normalized
     return out
 
 
+def _map_sheet_resort_names(
+    names: pd.Index | pd.Series, name_map: Dict[str, Optional[str]]
+) -> List[Optional[str]]:
+    """Strip and map a sheet's resort names in one vectorized pass.
+
+    Returns one entry per input name: the mapped name (or the stripped name when it isn't in
+    `name_map`), or None for blank/NaN names and names the map explicitly ignores.
+    """
+    names = pd.Series(names, dtype=object)
+    present = names.notna() & names.astype(bool)
+    stripped = names.astype(str).str.strip()
+    mapped = stripped.map(name_map).where(stripped.isin(list(name_map)), stripped)
+    return mapped.where(present & mapped.notna(), None).tolist()
+
+
 def _numeric_date_has_year(date_str: str) -> bool:
     return len(date_str.split('/')) == 3
 
 
+# The sheet repeats the same few date tokens across hundreds of cells, so the pure
+# token parsers below are memoized.
+@lru_cache(maxsize=4096)
 def _parse_numeric_date(date_str: str, default_year: Optional[int] = None) -> Optional[str]:
     date_str = date_str.strip()
     parts = date_str.split('/')
@@ -147,29 +195,27 @@ def _parse_numeric_date(date_str: str, default_year: Optional[int] = None) -> Op
         return None
 
 
-def _expand_numeric_part(part: str) -> List[str]:
+@lru_cache(maxsize=4096)
+def _expand_numeric_part(part: str) -> Tuple[str, ...]:
     cleaned = part.split('.', 1)[0].strip()
     if not cleaned:
-        return []
+        return ()
 
-    range_match = re.match(
-        r'^(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\s*-\s*(\d{1,2}/\d{1,2}(?:/\d{2,4})?)$',
-        cleaned,
-    )
+    range_match = _NUMERIC_RANGE_RE.match(cleaned)
     if range_match:
         start_raw, end_raw = range_match.groups()
         end_date = _parse_numeric_date(end_raw)
         if not end_date:
-            return []
+            return ()
         end_year = int(end_date.split('-', 1)[0])
         start_year = end_year if not _numeric_date_has_year(start_raw) else None
         start_date = _parse_numeric_date(start_raw, default_year=start_year)
         if not start_date:
-            return []
-        return get_all_dates_in_range(start_date, end_date)
+            return ()
+        return tuple(get_all_dates_in_range(start_date, end_date))
 
     single_date = _parse_numeric_date(cleaned)
-    return [single_date] if single_date else []
+    return (single_date,) if single_date else ()
 
 
 def print_blackout_name_mismatches(blackouts_df_raw: pd.DataFrame) -> None:
@@ -186,19 +232,18 @@ def print_blackout_name_mismatches(blackouts_df_raw: pd.DataFrame) -> None:
     resorts_df = pd.DataFrame(resorts_dict).transpose()
     blackouts_df_raw = _normalize_blackout_columns(blackouts_df_raw)
 
-    resorts_set = {str(name).strip() for name in resorts_df['name'].tolist() if name}
-    blackout_raw_list = [
-        str(name).strip()
-        for name in blackouts_df_raw['Resort'].tolist()
-        if name and str(name).strip()
-    ]
-    blackout_raw_set = set(blackout_raw_list)
+    resort_names = resorts_df['name'].dropna().astype(str)
+    resorts_idx = pd.Index(resort_names[resort_names != ''].str.strip().unique())
+    sheet_names = blackouts_df_raw['Resort'].dropna().astype(str).str.strip()
+    sheet_names = sheet_names[sheet_names != ''].drop_duplicates()
+    blackout_raw_set = set(sheet_names)
 
     blackout_mapped = []
     ignored_names = []
     remapped = []
-    for name in blackout_raw_set:
-        mapped = BLACKOUT_RESORT_NAME_MAP.get(name, name)
+    for name, mapped in zip(
+        sheet_names, _map_sheet_resort_names(sheet_names, BLACKOUT_RESORT_NAME_MAP)
+    ):
         if mapped is None:
             ignored_names.append(name)
             continue
@@ -206,14 +251,16 @@ def print_blackout_name_mismatches(blackouts_df_raw: pd.DataFrame) -> None:
             remapped.append((name, mapped))
         blackout_mapped.append(mapped)
 
-    missing_in_resorts = sorted(set(blackout_mapped) - resorts_set)
-    missing_in_blackout = sorted(resorts_set - set(blackout_mapped))
+    # Index.difference hashes and sorts in one go
+    blackout_idx = pd.Index(blackout_mapped).unique()
+    missing_in_resorts = blackout_idx.difference(resorts_idx).tolist()
+    missing_in_blackout = resorts_idx.difference(blackout_idx).tolist()
 
     logger.info('Blackout name QA summary')
     logger.info('%s', '-' * 30)
-    logger.info('Resorts in resorts_raw.json: %d', len(resorts_set))
+    logger.info('Resorts in resorts_raw.json: %d', len(resorts_idx))
     logger.info('Raw blackout sheet resort names: %d', len(blackout_raw_set))
-    logger.info('Names used after mapping: %d', len(set(blackout_mapped)))
+    logger.info('Names used after mapping: %d', len(blackout_idx))
 
     if ignored_names:
         logger.info('Ignored names (explicitly mapped to None):')
@@ -239,21 +286,27 @@ def print_blackout_name_mismatches(blackouts_df_raw: pd.DataFrame) -> None:
         logger.info('Blackout and resort names are in sync.')
 
 
-def _parse_named_ranges(df: pd.DataFrame) -> Dict[str, Dict]:
+def _parse_named_ranges(df: pd.DataFrame) -> Tuple[Dict[str, Dict], Dict[str, str]]:
     """Parse the column headers that represent named ranges.
 
-    Returns a mapping of named_range -> {'raw_text': str, 'dates': [YYYY-MM-DD,...]}
+    Returns a tuple of:
+    - a mapping of named_range -> {
+        'raw_text': str,
+        'dates': [YYYY-MM-DD,...],
+        'dates_set': frozenset of the same dates, for unioning into per-resort sets
+      }
+    - a rename mapping of full header -> named_range, for shortening the column labels
     """
     df = _normalize_blackout_columns(df)
 
     def _split_header(header: str) -> Optional[Tuple[str, str]]:
-        if "\n" in header:
-            return header.split("\n", 1)
-        if "\\n" in header:
-            return header.split("\\n", 1)
-        return None
+        name, sep, date_range = header.partition("\n")
+        if not sep:
+            name, sep, date_range = header.partition("\\n")
+        return (name, date_range) if sep else None
 
     named = {}
+    rename_map = {}
     for c in df.columns:
         if c in ["Resort", "Additional Blackout Dates"]:
             continue
@@ -262,7 +315,10 @@ def _parse_named_ranges(df: pd.DataFrame) -> Dict[str, Dict]:
         if not split_header:
             continue
         name, date_range = split_header
-        date_range = re.sub(r'\s*-\s*', ' - ', date_range.strip())
+        rename_map[c] = name
+        # normalize "Dec 20-Jan 4" / "Dec 20 -Jan 4" to "Dec 20 - Jan 4"
+        start_text, sep, end_text = date_range.strip().partition("-")
+        date_range = f"{start_text.rstrip()} - {end_text.lstrip()}" if sep else start_text
         start_date, end_date = split_date_range(date_range)
         dates = get_all_dates_in_range(start_date, end_date)
 
@@ -272,16 +328,15 @@ def _parse_named_ranges(df: pd.DataFrame) -> Dict[str, Dict]:
         elif name.strip().lower().startswith("peak sund"):
             dates = filter_dates_for_weekday(dates, weekday=6)
 
-        named[name] = {"raw_text": date_range, "dates": dates}
+        named[name] = {"raw_text": date_range, "dates": dates, "dates_set": frozenset(dates)}
 
-    return named
+    return named, rename_map
 
 
 def _season_weekend_dates(season_start: str, season_end: str) -> List[str]:
+    # The range is already sorted and unique, so one filtering pass keeps it that way
     dates = get_all_dates_in_range(season_start, season_end)
-    weekend = set(filter_dates_for_weekday(dates, weekday=5))
-    weekend.update(filter_dates_for_weekday(dates, weekday=6))
-    return sorted(weekend)
+    return [d for d in dates if date.fromisoformat(d).weekday() >= 5]
 
 
 def normalize_additional_dates(
@@ -294,23 +349,29 @@ def normalize_additional_dates(
     in comma lists inherit the previous month. Empty or NaN input yields an
     empty list.
     """
-    if not text or (isinstance(text, float) and pd.isna(text)):
+    # Cheap checks first: blank cells come through as NaN, and no real cell parses as a float
+    if text is None or isinstance(text, float):
         return []
-
     raw = str(text).strip()
     if not raw:
         return []
-    raw_lower = raw.lower()
-    if "weekend" in raw_lower or "saturday" in raw_lower or "sunday" in raw_lower:
+    return list(_normalize_additional_dates_cached(raw, season_start, season_end))
+
+
+@lru_cache(maxsize=512)
+def _normalize_additional_dates_cached(
+    raw: str, season_start: Optional[str], season_end: Optional[str]
+) -> Tuple[str, ...]:
+    """Memoized body of normalize_additional_dates; many resorts share identical cells."""
+    if _WEEKEND_RE.search(raw):
         if season_start and season_end:
-            return _season_weekend_dates(season_start, season_end)
-        return []
+            return tuple(_season_weekend_dates(season_start, season_end))
+        return ()
 
     raw = raw.replace(";", ",")
     parts = [p.strip() for p in raw.split(",") if p.strip()]
     out: List[str] = []
     last_month: Optional[str] = None
-    month_re = re.compile(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b')
 
     for part in parts:
         part = part.split('.', 1)[0].strip()
@@ -321,13 +382,13 @@ def normalize_additional_dates(
             out.extend(_expand_numeric_part(part))
             continue
 
-        month_match = month_re.search(part)
+        month_match = _MONTH_RE.search(part)
         if not month_match and last_month:
             if "-" in part:
                 start_raw, end_raw = [p.strip() for p in part.split("-", 1)]
-                if start_raw and not month_re.search(start_raw):
+                if start_raw and not _MONTH_RE.search(start_raw):
                     start_raw = f"{last_month} {start_raw}"
-                if end_raw and not month_re.search(end_raw):
+                if end_raw and not _MONTH_RE.search(end_raw):
                     end_raw = f"{last_month} {end_raw}"
                 part = f"{start_raw} - {end_raw}"
             else:
@@ -345,10 +406,10 @@ def normalize_additional_dates(
             if converted:
                 out.append(converted)
 
-        month_match = month_re.search(part)
+        month_match = _MONTH_RE.search(part)
         if month_match:
             last_month = month_match.group(1)
-    return sorted(set(out))
+    return tuple(sorted(set(out)))
 
 
 def parse_blackout_sheet(df_raw: pd.DataFrame) -> Dict[str, Dict]:
@@ -368,18 +429,19 @@ def parse_blackout_sheet(df_raw: pd.DataFrame) -> Dict[str, Dict]:
     """
 
     df_raw = _normalize_blackout_columns(df_raw)
-    named_ranges = _parse_named_ranges(df_raw)
-
-    def _header_name(header: str) -> str:
-        if "\n" in header:
-            return header.split("\n", 1)[0]
-        if "\\n" in header:
-            return header.split("\\n", 1)[0]
-        return header
-
-    blackout_dates_df = df_raw.copy()
-    blackout_dates_df.columns = [_header_name(c) for c in blackout_dates_df.columns]
-    blackout_dates_df = blackout_dates_df.set_index('Resort')
+    named_ranges, rename_map = _parse_named_ranges(df_raw)
+
+    # Keep only the columns read below: the resort names, the named ranges and the
+    # additional dates. Selected by position, since sheet headers can repeat.
+    parsed_cols = [
+        i
+        for i, col in enumerate(df_raw.columns)
+        if col in ('Resort', 'Additional Blackout Dates') or col in rename_map
+    ]
+    # Only the named-range headers ("Name\nMon D - Mon D") get shortened
+    blackout_dates_df = (
+        df_raw.iloc[:, parsed_cols].rename(columns=rename_map, copy=False).set_index('Resort')
+    )
     # drop legend row
     blackout_dates_df = blackout_dates_df[blackout_dates_df.index != "X = Blackout Date"]
 
@@ -389,39 +451,49 @@ def parse_blackout_sheet(df_raw: pd.DataFrame) -> Dict[str, Dict]:
     season_start = min(all_named_dates) if all_named_dates else None
     season_end = max(all_named_dates) if all_named_dates else None
 
-    for resort_name, row in blackout_dates_df.iterrows():
-        if not resort_name or (isinstance(resort_name, float) and pd.isna(resort_name)):
+    # Which named ranges each row flags ("X" or "Partial ..."), worked out one column at a
+    # time with vectorized string ops instead of per-cell lookups inside the row loop.
+    # Duplicate or missing headers aren't a single column, so (as before) they never flag.
+    range_flags = []
+    for name, info in named_ranges.items():
+        col = blackout_dates_df.get(name)
+        if not isinstance(col, pd.Series):
             continue
-        resort_name = str(resort_name).strip()
-        resort_name = BLACKOUT_RESORT_NAME_MAP.get(resort_name, resort_name)
+        cells = col.astype(str).str.strip().str.upper()
+        flagged = (cells.eq("X") | cells.str.startswith("PARTIAL")).to_numpy()
+        range_flags.append((name, info["dates_set"], flagged))
+
+    resort_names = _map_sheet_resort_names(blackout_dates_df.index, BLACKOUT_RESORT_NAME_MAP)
+    additional_col = blackout_dates_df.get("Additional Blackout Dates")
+    additional_cells = (
+        additional_col.tolist()
+        if isinstance(additional_col, pd.Series)
+        else [None] * len(blackout_dates_df)
+    )
+
+    for pos, (resort_name, additional_cell) in enumerate(zip(resort_names, additional_cells)):
         if resort_name is None:
             continue
 
         named_applied: List[str] = []
         all_dates = set()
 
-        for name, info in named_ranges.items():
-            try:
-                cell = row.get(name)
-            except Exception:
-                cell = None
-            if isinstance(cell, str):
-                cell_value = cell.strip().upper()
-                if cell_value == "X" or cell_value.startswith("PARTIAL"):
-                    named_applied.append(name)
-                    all_dates.update(info["dates"])
+        for name, dates_set, flagged in range_flags:
+            if flagged[pos]:
+                named_applied.append(name)
+                all_dates |= dates_set
 
         additional = normalize_additional_dates(
-            row.get("Additional Blackout Dates"),
+            additional_cell,
             season_start=season_start,
             season_end=season_end,
         )
-        for d in additional:
-            all_dates.add(d)
+        all_dates.update(additional)
 
+        # additional is already sorted and deduplicated by normalize_additional_dates
         resort_map[resort_name] = {
             "named_ranges": sorted(named_applied),
-            "additional_dates": sorted(additional),
+            "additional_dates": additional,
             "all_blackout_dates": sorted(all_dates),
         }
 
@@ -442,21 +514,29 @@ def merge_blackout_into_resorts(
     If a resort is not found in the blackout map, blanks are used.
     """
 
-    def _map_for_name(name: str) -> Tuple[str, str, str, int]:
-        info = blackout_map.get(name)
-        if not info:
-            return "", "[]", "[]", 0
-        named = ",".join(info.get("named_ranges", []))
-        additional = json.dumps(info.get("additional_dates", []))
-        all_dates = json.dumps(info.get("all_blackout_dates", []))
-        count = len(info.get("all_blackout_dates", []))
-        return named, additional, all_dates, count
-
-    mapped = resorts_df["name"].apply(lambda n: _map_for_name(n))
-    resorts_df["blackout_named_ranges"] = mapped.apply(lambda t: t[0])
-    resorts_df["blackout_additional_dates"] = mapped.apply(lambda t: t[1])
-    resorts_df["blackout_all_dates"] = mapped.apply(lambda t: t[2])
-    resorts_df["blackout_count"] = mapped.apply(lambda t: t[3])
+    empty: Tuple[str, str, str, int] = ("", "[]", "[]", 0)
+    serialized: Dict[str, Tuple[str, str, str, int]] = {
+        resort: (
+            ",".join(info.get("named_ranges", [])),
+            json.dumps(info.get("additional_dates", [])),
+            json.dumps(info.get("all_blackout_dates", [])),
+            len(info.get("all_blackout_dates", [])),
+        )
+        for resort, info in blackout_map.items()
+        if info
+    }
+
+    columns = [
+        "blackout_named_ranges",
+        "blackout_additional_dates",
+        "blackout_all_dates",
+        "blackout_count",
+    ]
+    resorts_df[columns] = pd.DataFrame(
+        [serialized.get(n, empty) for n in resorts_df["name"]],
+        columns=columns,
+        index=resorts_df.index,
+    )
 
     missing_in_resorts = sorted(set(blackout_map.keys()) - set(resorts_df["name"]))
     if missing_in_resorts:
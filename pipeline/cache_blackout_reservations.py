@@ -6,7 +6,7 @@ import argparse
 import logging
 from pathlib import Path
 
-import requests
+from utils import fetch_text_if_modified
 
 BLACKOUT_RESERVATIONS_URL = "https://www.indyskipass.com/blackout-dates-reservations"
 
@@ -21,7 +21,8 @@ def fetch_blackout_reservations_html(
     Fetch the blackout/reservations page HTML.
 
     read_mode:
-        - "live": fetch from the web and write to cache_path
+        - "live": fetch from the web and write to cache_path (a conditional GET, so an
+          unchanged page is served from cache_path without re-downloading it)
         - "cache": read from cache_path
     """
     if read_mode not in ("live", "cache"):
@@ -31,11 +32,7 @@ def fetch_blackout_reservations_html(
     if read_mode == "cache":
         return cache_file.read_text(encoding="utf-8")
 
-    response = requests.get(BLACKOUT_RESERVATIONS_URL, timeout=10)
-    response.raise_for_status()
-    cache_file.parent.mkdir(parents=True, exist_ok=True)
-    cache_file.write_text(response.text, encoding="utf-8")
-    return response.text
+    return fetch_text_if_modified(BLACKOUT_RESERVATIONS_URL, str(cache_file), timeout=10)
 
 
 def main() -> None:
@@ -27,19 +27,24 @@ import json
 import logging
 import os
 import re
+from io import StringIO
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 try:
     from src.blackout import normalize_additional_dates, _parse_named_ranges
-    from src.utils import get_all_dates_in_range
+    from src.utils import fetch_text_if_modified, get_all_dates_in_range
 except ModuleNotFoundError:
     from blackout import normalize_additional_dates, _parse_named_ranges
-    from utils import get_all_dates_in_range
+    from utils import fetch_text_if_modified, get_all_dates_in_range
 
 LTT_GSHEET_URL = 'https://docs.google.com/spreadsheets/d/e/2PACX-1vTUXA5uhe2QwuQvCTpaSpIQmNNWIAp4gADGo5DIUeDwMOfgg9a8nEMU2K_4J9_24E2dGaLgbBnplpqg/pub?gid=484077440&single=true&output=csv'
 
+# Last downloaded LTT sheet CSV and its HTTP validators (.meta.json)
+LTT_SHEET_HTTP_CACHE = 'cache/ltt_dates_sheet.csv'
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,7 +82,8 @@ def get_ltt_dates_from_google_sheets(
         return pd.read_csv(cache_path)
 
     logger.info('Fetching LTT dates from Google Sheets URL: %s', sheet_url)
-    return pd.read_csv(sheet_url)
+    csv_text = fetch_text_if_modified(sheet_url, LTT_SHEET_HTTP_CACHE)
+    return pd.read_csv(StringIO(csv_text))
 
 
 def _normalize_ltt_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -89,21 +95,31 @@ def _normalize_ltt_columns(df: pd.DataFrame) -> pd.DataFrame:
         else:
             col_str = '' if col is None else str(col).strip()
             normalized.append(col_str)
-    out = df.copy()
+    out = df.copy(deep=False)  # labels only
     out.columns = normalized
     return out
 
 
+# Match: start MM/DD (no year, not preceded by / or digit) - end MM/DD/YY or MM/DD/YYYY
+# Negative lookbehind (?<![/\d]) ensures we don't match a 2-part slice of a 3-part date.
+# Negative lookahead (?!/\d) ensures start is truly 2-part (no trailing /year).
+_CROSS_YEAR_RE = re.compile(
+    r'(?<![/\d])(\d{1,2}/\d{1,2})(?!/\d)\s*-\s*(\d{1,2}/\d{1,2}/(\d{2,4}))\b'
+)
+
 _LTT_DATA_VALUES = {'BLACKOUT', 'NO BLACKOUT', 'PARTIAL (SEE ADDITIONAL)', 'PARTIAL'}
 
 
-def _is_valid_data_row(row: pd.Series, named_range_cols: List[str]) -> bool:
-    """Return True if the row has at least one real LTT data value in the named-range columns."""
+def _valid_data_rows(df: pd.DataFrame, named_range_cols: List[str]) -> np.ndarray:
+    """Flag rows with at least one real LTT data value in the named-range columns."""
+    valid = np.zeros(len(df), dtype=bool)
     for col in named_range_cols:
-        val = row.get(col)
-        if isinstance(val, str) and val.strip().upper() in _LTT_DATA_VALUES:
-            return True
-    return False
+        cells = df.get(col)
+        # Duplicate or missing headers aren't a single column, so they never count
+        if not isinstance(cells, pd.Series):
+            continue
+        valid |= cells.astype(str).str.strip().str.upper().isin(_LTT_DATA_VALUES).to_numpy()
+    return valid
 
 
 def _deduplicate_ltt_resorts(df: pd.DataFrame, named_range_cols: List[str]) -> pd.DataFrame:
@@ -111,34 +127,16 @@ def _deduplicate_ltt_resorts(df: pd.DataFrame, named_range_cols: List[str]) -> p
 
     The duplicate rows are either empty, contain holiday-label strings (e.g.,
     'Christmas/New Year') or all-'No Survey' values. The data row has BLACKOUT /
-    NO BLACKOUT / PARTIAL values in the named-range columns.
+    NO BLACKOUT / PARTIAL values in the named-range columns. Rows without a name, and
+    names with no valid row at all, are dropped; if a name has several valid rows the
+    last one wins. Row order is preserved.
     """
     resort_col = df['Resort']
-    seen: dict[str, int] = {}  # name -> first valid row index
-    drop_indices = []
-
-    for idx, row in df.iterrows():
-        name = str(row['Resort']).strip() if pd.notna(row['Resort']) else ''
-        if not name:
-            drop_indices.append(idx)
-            continue
-
-        is_valid = _is_valid_data_row(row, named_range_cols)
-
-        if name not in seen:
-            seen[name] = idx
-            if not is_valid:
-                drop_indices.append(idx)
-        else:
-            prev_idx = seen[name]
-            if is_valid:
-                # Replace the previously recorded (invalid) row with this valid one
-                drop_indices.append(prev_idx)
-                seen[name] = idx
-            else:
-                drop_indices.append(idx)
-
-    return df.drop(index=drop_indices)
+    names = resort_col.where(resort_col.notna(), '').astype(str).str.strip()
+    candidates = _valid_data_rows(df, named_range_cols) & names.ne('').to_numpy()
+    keep = candidates.copy()
+    keep[candidates] = ~names[candidates].duplicated(keep='last').to_numpy()
+    return df[keep]
 
 
 def _fix_cross_year_numeric_ranges(text: str) -> str:
@@ -148,10 +146,9 @@ def _fix_cross_year_numeric_ranges(text: str) -> str:
     Without this fix, the start date would inherit the end year (2026) and produce
     2026-12-26, which is after 2026-01-02 and would yield an empty range.
     """
-    # Match: start MM/DD (no year, not preceded by / or digit) - end MM/DD/YY or MM/DD/YYYY
-    # Negative lookbehind (?<![/\d]) ensures we don't match a 2-part slice of a 3-part date.
-    # Negative lookahead (?!/\d) ensures start is truly 2-part (no trailing /year).
-    pattern = re.compile(r'(?<![/\d])(\d{1,2}/\d{1,2})(?!/\d)\s*-\s*(\d{1,2}/\d{1,2}/(\d{2,4}))\b')
+    # Most cells have no numeric range at all, so skip the regex for them
+    if '-' not in text or '/' not in text:
+        return text
 
     def _fix_match(m: re.Match) -> str:
         start_raw, end_raw, year_raw = m.group(1), m.group(2), m.group(3)
@@ -171,7 +168,7 @@ def _fix_cross_year_numeric_ranges(text: str) -> str:
             return f'{start_raw}/{short_start_year}-{end_raw}'
         return m.group(0)
 
-    return pattern.sub(_fix_match, text)
+    return _CROSS_YEAR_RE.sub(_fix_match, text)
 
 
 def _normalize_ltt_additional_dates(
@@ -204,36 +201,41 @@ def parse_ltt_sheet(df_raw: pd.DataFrame) -> Dict[str, Dict]:
     """
     df_raw = _normalize_ltt_columns(df_raw)
     # Parse named ranges from headers (reuses blackout logic — same header format)
-    named_ranges = _parse_named_ranges(df_raw)
+    # rename_map maps each full named-range header ("Name\nMon D - Mon D") to its short name
+    named_ranges, rename_map = _parse_named_ranges(df_raw)
 
-    named_range_col_names = list(named_ranges.keys())
+    # Deduplicate using the FULL column names since df_raw hasn't been renamed yet
+    df_raw = _deduplicate_ltt_resorts(df_raw, list(rename_map))
 
-    # Deduplicate using the FULL column names (with \n date range) since df_raw hasn't been
-    # renamed yet. Named-range columns are those whose header contains \n or \\n.
-    named_range_full_cols = [
-        c for c in df_raw.columns if c != 'Resort' and ('\n' in str(c) or '\\n' in str(c))
-    ]
-    df_raw = _deduplicate_ltt_resorts(df_raw, named_range_full_cols)
-
-    # Rename columns to short names for lookup
-    def _header_name(header: str) -> str:
-        if '\n' in header:
-            return header.split('\n', 1)[0]
-        if '\\n' in header:
-            return header.split('\\n', 1)[0]
-        return header
-
-    ltt_df = df_raw.copy()
-    ltt_df.columns = [_header_name(c) for c in ltt_df.columns]
-    ltt_df = ltt_df.set_index('Resort')
+    # Rename columns to short names for lookup. df_raw is already a fresh frame from the
+    # dedup mask, so there's no need to copy the cells.
+    ltt_df = df_raw.rename(columns=rename_map, copy=False).set_index('Resort')
 
     all_named_dates = [d for info in named_ranges.values() for d in info.get('dates', [])]
     season_start = min(all_named_dates) if all_named_dates else None
     season_end = max(all_named_dates) if all_named_dates else None
 
+    # Normalize each named-range column once with vectorized string ops, then work out which
+    # rows it blacks out and which rows have no survey answer for it. Duplicate or missing
+    # headers aren't a single column, so (as before) they never flag and read as blank.
+    range_flags = []
+    no_survey = np.ones(len(ltt_df), dtype=bool)
+    for name, info in named_ranges.items():
+        col = ltt_df.get(name)
+        if not isinstance(col, pd.Series):
+            continue
+        cells = col.astype(str).str.strip().str.upper()
+        range_flags.append((name, info['dates_set'], cells.eq('BLACKOUT').to_numpy()))
+        no_survey &= cells.isin(('NO SURVEY', '', 'NAN')).to_numpy()
+
+    additional_col = ltt_df.get('Additional Blackout Dates/Details')
+    additional_cells = (
+        additional_col.tolist() if isinstance(additional_col, pd.Series) else [None] * len(ltt_df)
+    )
+
     resort_map: Dict[str, Dict] = {}
 
-    for resort_name, row in ltt_df.iterrows():
+    for pos, resort_name in enumerate(ltt_df.index):
         if not resort_name or (isinstance(resort_name, float) and pd.isna(resort_name)):
             continue
         resort_name = str(resort_name).strip()
@@ -242,32 +244,22 @@ def parse_ltt_sheet(df_raw: pd.DataFrame) -> Dict[str, Dict]:
             continue
 
         # Skip rows where all named-range cells are 'No Survey' or blank
-        all_cells = [str(row.get(name, '')).strip().upper() for name in named_range_col_names]
-        if all(c in ('NO SURVEY', '', 'NAN') for c in all_cells):
+        if no_survey[pos]:
             logger.debug('Skipping LTT resort with no survey data: %s', resort_name)
             continue
 
         named_applied: List[str] = []
         all_dates: set = set()
 
-        for name, info in named_ranges.items():
-            try:
-                cell = row.get(name)
-            except Exception:
-                cell = None
-            if not isinstance(cell, str):
-                continue
-            cell_upper = cell.strip().upper()
-            if cell_upper == 'BLACKOUT':
-                # Apply full named range
+        # Only BLACKOUT applies a full named range. PARTIAL (SEE ADDITIONAL) leaves the
+        # specific dates to the additional dates column; NO BLACKOUT / blank / No Survey skip.
+        for name, dates_set, flagged in range_flags:
+            if flagged[pos]:
                 named_applied.append(name)
-                all_dates.update(info['dates'])
-            # PARTIAL (SEE ADDITIONAL): named range does NOT apply wholesale;
-            # the additional dates column will contain the specific blackout dates.
-            # NO BLACKOUT / blank / No Survey: skip.
+                all_dates |= dates_set
 
         additional = _normalize_ltt_additional_dates(
-            row.get('Additional Blackout Dates/Details'),
+            additional_cells[pos],
             season_start=season_start,
             season_end=season_end,
         )
@@ -276,7 +268,7 @@ def parse_ltt_sheet(df_raw: pd.DataFrame) -> Dict[str, Dict]:
         resort_map[mapped_name] = {
             'ltt_available': True,
             'named_ranges': sorted(named_applied),
-            'additional_dates': sorted(additional),
+            'additional_dates': additional,  # already sorted and deduplicated
             'all_ltt_blackout_dates': sorted(all_dates),
         }
 
@@ -294,18 +286,23 @@ def merge_ltt_into_resorts(resorts_df: pd.DataFrame, ltt_map: Dict[str, Dict]) -
     Resorts not found in the LTT map get ltt_available=False and empty blackout lists.
     """
 
-    def _map_for_name(name: str) -> Tuple[bool, str, int]:
-        info = ltt_map.get(name)
-        if not info:
-            return False, '[]', 0
-        all_dates = json.dumps(info.get('all_ltt_blackout_dates', []))
-        count = len(info.get('all_ltt_blackout_dates', []))
-        return True, all_dates, count
-
-    mapped = resorts_df['name'].apply(lambda n: _map_for_name(n))
-    resorts_df['ltt_available'] = mapped.apply(lambda t: t[0])
-    resorts_df['ltt_blackout_all_dates'] = mapped.apply(lambda t: t[1])
-    resorts_df['ltt_blackout_count'] = mapped.apply(lambda t: t[2])
+    empty: Tuple[bool, str, int] = (False, '[]', 0)
+    serialized: Dict[str, Tuple[bool, str, int]] = {
+        name: (
+            True,
+            json.dumps(info.get('all_ltt_blackout_dates', [])),
+            len(info.get('all_ltt_blackout_dates', [])),
+        )
+        for name, info in ltt_map.items()
+        if info
+    }
+
+    columns = ['ltt_available', 'ltt_blackout_all_dates', 'ltt_blackout_count']
+    resorts_df[columns] = pd.DataFrame(
+        [serialized.get(n, empty) for n in resorts_df['name']],
+        columns=columns,
+        index=resorts_df.index,
+    )
 
     missing_in_resorts = sorted(set(ltt_map.keys()) - set(resorts_df['name']))
     if missing_in_resorts:
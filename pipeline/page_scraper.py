@@ -3,17 +3,44 @@ Scrapes data from resorts from general resorts page and resort-specific pages
 """
 
 import argparse
+import hashlib
 import json
 import logging
+import os
 import re
-import time
-import requests
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-from bs4 import BeautifulSoup
+import bs4
+import lxml.etree
+from bs4 import BeautifulSoup, SoupStrainer
+
+from utils import RequestPacer, get_http_session
 
 CACHE_DIRECTORY = 'cache/'
+PAGE_CHUNK_SIZE = 64 * 1024
 OUR_RESORTS_URL = 'https://www.indyskipass.com/our-resorts'
 
+# Resort pages are fetched a few at a time so network latency overlaps, but live requests
+# still start at most once every LIVE_REQUEST_INTERVAL seconds to be polite to Indy's servers
+SCRAPE_MAX_WORKERS = 4
+LIVE_REQUEST_INTERVAL = 0.5
+_live_request_pacer = RequestPacer(LIVE_REQUEST_INTERVAL)
+
+_DIGITS_RE = re.compile(r'\d+')
+# WKT point as used in the resort cards' data-location: 'POINT (longitude latitude)'
+_POINT_RE = re.compile(r'POINT\s*\(\s*([-+\d.eE]+)\s+([-+\d.eE]+)\s*\)')
+# Card and resort page flags are 'true'/'false' or 'Yes'/'No'
+_TRUTHY = frozenset(('true', 'yes'))
+
+# Digest of this module's source and the parser library versions, mixed into each resort page
+# digest so that editing the parser or upgrading bs4/lxml invalidates every recorded parse
+_parser_hasher = hashlib.blake2b(digest_size=16)
+with open(__file__, 'rb') as _source:
+    _parser_hasher.update(_source.read())
+_parser_hasher.update(f'\0{bs4.__version__}\0{lxml.etree.LXML_VERSION}'.encode('utf-8'))
+_PARSER_DIGEST = _parser_hasher.digest()
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,16 +54,34 @@ def get_page_html(page_url: str, read_mode: str, cache_page=True) -> str:
     if read_mode == 'live':
         # Load page from URL
         logger.info('Fetching contents from web page: "%s"', page_url)
-        page = requests.get(page_url, timeout=5)
-        page_html = page.text
-
-        if cache_page:
-            logger.info('Caching web page to file: "%s"', cache_file)
-            try:
-                with open(cache_file, 'x', encoding='utf-8') as f:
-                    f.write(page_html)
-            except FileExistsError:
-                logger.info('Cache file already exists: "%s"', cache_file)
+        _live_request_pacer.wait()
+        # Shared session: pages all come from the same host, so reuse keep-alive connections
+        with get_http_session().get(page_url, timeout=5, stream=True) as page:
+            page.raise_for_status()
+            # Pages are decoded as UTF-8 whatever the headers claim (requests falls back to
+            # ISO-8859-1 without a charset), so live and cache reads of a page agree
+            if not cache_page:
+                page_html = page.content.decode('utf-8')
+            else:
+                logger.info('Caching web page to file: "%s"', cache_file)
+                os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+                # The body streams into a temp file that is linked into place only once it has
+                # fully arrived, so a failed download never leaves a truncated cached page
+                fd, part_file = tempfile.mkstemp(dir=CACHE_DIRECTORY, suffix='.part')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        for chunk in page.iter_content(chunk_size=PAGE_CHUNK_SIZE):
+                            f.write(chunk)
+                    # Decoded before caching, so a page that isn't valid UTF-8 raises here
+                    # instead of leaving a cache file that cache mode can't read
+                    with open(part_file, 'r', encoding='utf-8') as f:
+                        page_html = f.read()
+                    try:
+                        os.link(part_file, cache_file)
+                    except FileExistsError:
+                        logger.info('Cache file already exists: "%s"', cache_file)
+                finally:
+                    os.unlink(part_file)
 
     else:  # read_mode == 'cache'
         logger.info('Fetching contents from cached file: "%s"', cache_file)
@@ -53,7 +98,12 @@ def get_numbers(text: str) -> int:
     TODO: We might want to generalize this to work for decimal values.
           Would just need to extract decimal points, then cast as float.
     """
-    numbers = re.findall(r'\d+', text)
+    # Most field values are already bare numbers, which don't need the regex. isascii()
+    # keeps out other Unicode digit characters, which isdigit() accepts but int() may not.
+    stripped = text.strip()
+    if stripped.isascii() and stripped.isdigit():
+        return int(stripped)
+    numbers = _DIGITS_RE.findall(text)
     if len(numbers) == 1:
         return int(numbers[0])
     else:
@@ -64,25 +114,28 @@ def parse_lat_long(point_string: str):
     """
     Extracts latitude and longitude from a string in the format: 'POINT (longitude latitude)'.
     """
-    coords = point_string.replace("POINT (", "").replace(")", "").split()
-    longitude, latitude = map(float, coords)
-    return {'latitude': latitude, 'longitude': longitude}
+    match = _POINT_RE.match(point_string)
+    if not match:
+        raise ValueError(f'Unrecognized point string: "{point_string}"')
+    return {'latitude': float(match.group(2)), 'longitude': float(match.group(1))}
 
 
 def parse_vertical(vertical_str: str):
     """
-    Extracts the vertical height in feet
+    Extracts the vertical height in feet, e.g. '2100ft' or '2,100 ft'
     """
-    if vertical_str.endswith('ft'):
-        return int(vertical_str[:-2])
-    return None
+    vertical_str = vertical_str.strip()
+    feet = vertical_str.removesuffix('ft')
+    if feet == vertical_str:
+        return None
+    return int(feet.replace(',', ''))
 
 
 def to_boolean(data_string: str) -> bool:
     """
     Converts specified string values to boolean
     """
-    return data_string.lower() in ('true', 'yes')
+    return data_string.lower() in _TRUTHY
 
 
 def get_class_value(page_body, class_name: str) -> str:
@@ -101,8 +154,8 @@ def parse_our_resorts_page(page_html: str) -> dict:
     gets resorts data from 'our-resorts.html'
     """
 
-    soup = BeautifulSoup(page_html, 'html.parser')
-    logger.info('Page title: "%s"', soup.title)
+    # Only the main content holds resort cards, so have lxml build just that subtree
+    soup = BeautifulSoup(page_html, 'lxml', parse_only=SoupStrainer(id='main-content'))
 
     page_body = soup.find(id='main-content')
     resort_node_class = 'node--type-resort'
@@ -113,15 +166,14 @@ def parse_our_resorts_page(page_html: str) -> dict:
         resort_node_class,
     )
 
-    resort_node_list = list(resort_nodes)
     resorts = {}
     success_count = 0
     failed_count = 0
-    for resort_node in resort_node_list:
-        _id = None
-        try:
-            _id = resort_node['data-history-node-id']
-        except KeyError:
+    for resort_node in resort_nodes:
+        # Card data lives in the node's attributes; missing ones are read as None
+        attrs = resort_node.attrs
+        _id = attrs.get('data-history-node-id')
+        if _id is None:
             logger.warning('Resort missing ID! Skipping')
             failed_count += 1
 
@@ -141,75 +193,95 @@ def parse_our_resorts_page(page_html: str) -> dict:
 
         name = resort_node.select_one("span.label").get_text(strip=True)
         location_name = resort_node.select_one("span.location").get_text(strip=True)
-        is_open_nights = to_boolean(
-            resort_node.select_one("li:nth-child(4) .value").get_text(strip=True)
-        )
-        has_terrain_parks = to_boolean(
-            resort_node.select_one("li:nth-child(5) .value").get_text(strip=True)
-        )
+
+        # Card stats, in order: vertical, trails, lifts, night skiing, terrain parks.
+        # Positions count only the items of the list holding the stat values, so other lists
+        # on the card (tags, badges) can't shift them.
+        first_value = resort_node.find(class_='value')
+        stats_list = first_value.find_parent('ul') if first_value else None
+        stat_items = stats_list.find_all('li', recursive=False, limit=5) if stats_list else []
+        stat_values = []
+        for item in stat_items:
+            value = item.find(class_='value')
+            stat_values.append(value.get_text(strip=True) if value else None)
+        stat_values += [None] * (5 - len(stat_values))
+        vert_str, trails, lifts, open_nights, terrain_parks = stat_values
+
+        # Missing card stats and attributes are reported in one warning per resort
+        missing = []
 
         try:
-            vert_str = resort_node.select_one("li:nth-child(1) .value").get_text(strip=True)
-            if vert_str.strip() == '- -':
+            if vert_str is None:
+                missing.append('vertical')
+            elif vert_str == '- -':
                 logger.debug('No vertical data for resort ID %s (value: "- -")', _id)
             else:
                 vertical = parse_vertical(vert_str)
-        except KeyError:
-            logger.warning('Could not get vertical for resort ID: %s', _id)
         except ValueError:
             logger.warning('Could not parse vertical "%s" for resort ID %s', vert_str, _id)
 
         try:
-            trails = resort_node.select_one("li:nth-child(2) .value").get_text(strip=True)
-            if trails.strip() == '- -':
+            if trails is None:
+                missing.append('trails')
+            elif trails == '- -':
                 logger.debug('No trail data for resort ID %s (value: "- -")', _id)
             else:
                 num_trails = int(trails)
-        except KeyError:
-            logger.warning('Could not get trails for resort ID: %s', _id)
         except ValueError:
             logger.warning('Could not parse trail number "%s" for resort ID %s', trails, _id)
 
         try:
-            lifts = resort_node.select_one("li:nth-child(3) .value").get_text(strip=True)
-            if lifts.strip() == '- -':
+            if lifts is None:
+                missing.append('lifts')
+            elif lifts == '- -':
                 logger.debug('No lift data for resort ID %s (value: "- -")', _id)
             else:
                 num_lifts = int(lifts)
-        except KeyError:
-            logger.warning('Could not get lifts for resort ID: %s', _id)
         except ValueError:
             logger.warning('Could not parse lift number "%s" for resort ID %s', lifts, _id)
 
-        try:
-            coordinates = parse_lat_long(resort_node['data-location'])
-        except KeyError:
-            logger.warning('Could not get coordinate location for resort ID: %s', _id)
-
-        try:
-            is_nordic = to_boolean(resort_node['data-isnordic'])
-        except KeyError:
-            logger.warning('Could not get is_nordic for resort ID: %s', _id)
-
-        try:
-            is_alpine_xc = to_boolean(resort_node['data-isalpinexc'])
-        except KeyError:
-            logger.warning('Could not get is_alpine_xc for resort ID: %s', _id)
-
-        try:
-            is_xc_only = to_boolean(resort_node['data-isxconly'])
-        except KeyError:
-            logger.warning('Could not get is_xc_only for resort ID: %s', _id)
-
-        try:
-            is_allied = to_boolean(resort_node['data-isallied'])
-        except KeyError:
-            logger.warning('Could not get is_allied for resort ID: %s', _id)
-
-        try:
-            href = resort_node['href']
-        except KeyError:
-            logger.warning('Could not get href for resort ID: %s', _id)
+        if open_nights is not None:
+            is_open_nights = to_boolean(open_nights)
+        else:
+            missing.append('open_nights')
+
+        if terrain_parks is not None:
+            has_terrain_parks = to_boolean(terrain_parks)
+        else:
+            missing.append('terrain_parks')
+
+        location = attrs.get('data-location')
+        if location is not None:
+            coordinates = parse_lat_long(location)
+        else:
+            missing.append('coordinates')
+
+        if (value := attrs.get('data-isnordic')) is not None:
+            is_nordic = to_boolean(value)
+        else:
+            missing.append('is_nordic')
+
+        if (value := attrs.get('data-isalpinexc')) is not None:
+            is_alpine_xc = to_boolean(value)
+        else:
+            missing.append('is_alpine_xc')
+
+        if (value := attrs.get('data-isxconly')) is not None:
+            is_xc_only = to_boolean(value)
+        else:
+            missing.append('is_xc_only')
+
+        if (value := attrs.get('data-isallied')) is not None:
+            is_allied = to_boolean(value)
+        else:
+            missing.append('is_allied')
+
+        href = attrs.get('href')
+        if href is None:
+            missing.append('href')
+
+        if missing:
+            logger.warning('Could not get %s for resort ID: %s', ', '.join(missing), _id)
 
         resorts[_id] = {
             'name': name,
@@ -233,9 +305,6 @@ def parse_our_resorts_page(page_html: str) -> dict:
     if failed_count:
         logger.warning('Failed to parse %d resorts', failed_count)
 
-    with open('data/resorts_raw.json', 'w', encoding='utf-8') as json_file:
-        json.dump(resorts, json_file, indent=4)
-
     return resorts
 
 
@@ -255,7 +324,7 @@ def parse_resort_page(html_content: str, resort_id: str, resort_slug: str) -> di
     - lifts
     - cross-country trails and difficulty coverage (-xc suffixed fields)
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, 'lxml')
     resort_data = {}
 
     resort_data['id'] = resort_id
@@ -269,28 +338,35 @@ def parse_resort_page(html_content: str, resort_id: str, resort_slug: str) -> di
     url_button = button_div.find('a', class_='button-inverted')
     resort_data['website'] = url_button['href'] if url_button else None
 
+    # Index every div by each of its classes (first match in document order, as soup.find
+    # would return) so the field lookups below are dict hits instead of full-tree searches
+    divs_by_class = {}
+    for div in soup.find_all('div', class_=True):
+        for class_name in div['class']:
+            divs_by_class.setdefault(class_name, div)
+
     # Trails
-    trails_field = soup.find('div', class_='field--name-field-trails')
+    trails_field = divs_by_class.get('field--name-field-trails')
     # Use get_numbers to avoid ValueError on malformed digits
     resort_data['trails'] = get_numbers(trails_field.text.strip()) if trails_field else 0
 
     # Trails (cross-country) — separate -xc suffixed element on alpine+XC and XC-only pages.
     # None (not 0) when absent: a resort with no XC section simply has no XC trail count.
-    trails_xc_field = soup.find('div', class_='field--name-field-trails-xc')
+    trails_xc_field = divs_by_class.get('field--name-field-trails-xc')
     resort_data['trails_xc'] = (
         get_numbers(trails_xc_field.text.strip()) if trails_xc_field else None
     )
 
     # Lifts
-    lifts_field = soup.find('div', class_='field--name-field-lifts')
+    lifts_field = divs_by_class.get('field--name-field-lifts')
     resort_data['lifts'] = get_numbers(lifts_field.text.strip()) if lifts_field else 0
 
     # Acres
-    acres_field = soup.find('div', class_='field--name-field-acres')
+    acres_field = divs_by_class.get('field--name-field-acres')
     resort_data['acres'] = get_numbers(acres_field.text.strip()) if acres_field else None
 
     # Trail Length
-    trail_length_field = soup.find('div', class_='field--name-field-trail-length')
+    trail_length_field = divs_by_class.get('field--name-field-trail-length')
     resort_data['trail_length_km'] = (
         get_numbers(trail_length_field.text.strip()) if trail_length_field else None
     )
@@ -305,22 +381,22 @@ def parse_resort_page(html_content: str, resort_id: str, resort_slug: str) -> di
     resort_data['is_cross_country'] = 'cross country' in type_text
 
     # Dog friendly
-    dog_field = soup.find('div', class_='field--name-field-dog-friendly')
+    dog_field = divs_by_class.get('field--name-field-dog-friendly')
     resort_data['is_dog_friendly'] = 'Yes' in dog_field.text.strip() if dog_field else False
 
     # Snowshoeing
-    snowshoe_field = soup.find('div', class_='field--name-field-snowshoeing')
+    snowshoe_field = divs_by_class.get('field--name-field-snowshoeing')
     resort_data['has_snowshoeing'] = (
         'Yes' in snowshoe_field.text.strip() if snowshoe_field else False
     )
 
     # Terrain parks
-    terrain_parks_field = soup.find('div', class_='field--name-field-terrain-parks')
+    terrain_parks_field = divs_by_class.get('field--name-field-terrain-parks')
     if terrain_parks_field:
         resort_data['terrain_parks'] = 'Yes' in terrain_parks_field.text.strip()
 
     # Night skiing
-    night_skiing_field = soup.find('div', class_='field--name-field-night-skiing')
+    night_skiing_field = divs_by_class.get('field--name-field-night-skiing')
     if night_skiing_field:
         resort_data['night_skiing'] = 'Yes' in night_skiing_field.text.strip()
 
@@ -329,15 +405,15 @@ def parse_resort_page(html_content: str, resort_id: str, resort_slug: str) -> di
     resort_data['vertical_summit_ft'] = None
     resort_data['vertical_elevation_ft'] = None
 
-    base_div = soup.find('div', class_='elevation__tag--base')
+    base_div = divs_by_class.get('elevation__tag--base')
     if base_div:
         resort_data['vertical_base_ft'] = get_numbers(base_div.text.strip())
 
-    summit_div = soup.find('div', class_='elevation__tag--summit')
+    summit_div = divs_by_class.get('elevation__tag--summit')
     if summit_div:
         resort_data['vertical_summit_ft'] = get_numbers(summit_div.text.strip())
 
-    elevation_div = soup.find('div', class_='elevation__tag--vertical')
+    elevation_div = divs_by_class.get('elevation__tag--vertical')
     if elevation_div:
         resort_data['vertical_elevation_ft'] = get_numbers(elevation_div.text.strip())
 
@@ -347,7 +423,7 @@ def parse_resort_page(html_content: str, resort_id: str, resort_slug: str) -> di
     resort_data['difficulty_advanced'] = None
 
     for level in ['beginner', 'intermediate', 'advanced']:
-        diff_class = soup.find('div', class_=f'field--name-field-{level}')
+        diff_class = divs_by_class.get(f'field--name-field-{level}')
         if diff_class:
             resort_data[f'difficulty_{level}'] = get_numbers(diff_class.text.strip())
 
@@ -357,14 +433,14 @@ def parse_resort_page(html_content: str, resort_id: str, resort_slug: str) -> di
     resort_data['difficulty_advanced_xc'] = None
 
     for level in ['beginner', 'intermediate', 'advanced']:
-        diff_class_xc = soup.find('div', class_=f'field--name-field-{level}-xc')
+        diff_class_xc = divs_by_class.get(f'field--name-field-{level}-xc')
         if diff_class_xc:
             resort_data[f'difficulty_{level}_xc'] = get_numbers(diff_class_xc.text.strip())
 
     # Snowfall
     resort_data['snowfall_average_in'] = None
     resort_data['snowfall_high_in'] = None
-    snowfall_field = soup.find('div', class_='snowfall--content')
+    snowfall_field = divs_by_class.get('snowfall--content')
     if snowfall_field:
         for snow_type in ['average', 'high']:
             snowfall_div = snowfall_field.find('div', class_=f'label {snow_type}')
@@ -383,14 +459,14 @@ def cache_our_resorts_page(read_mode='live') -> str:
     return get_page_html(OUR_RESORTS_URL, read_mode=read_mode)
 
 
-def parse_and_save_our_resorts(page_html: str, output_path='data/our_resorts_raw.json') -> dict:
+def parse_and_save_our_resorts(page_html: str, output_path='data/resorts_raw.json') -> dict:
     """
-    Parses the 'our resorts' HTML and saves the parsed data to JSON.
+    Parses the 'our resorts' HTML and saves the parsed data to JSON at output_path.
     Returns the parsed resorts dict.
     """
     resorts = parse_our_resorts_page(page_html)
     with open(output_path, 'w', encoding='utf-8') as json_file:
-        json.dump(resorts, json_file, indent=4)
+        json_file.write(json.dumps(resorts, indent=4))
     return resorts
 
 
@@ -403,9 +479,42 @@ def cache_and_parse_resort(
     url = f'https://www.indyskipass.com{resort_href}'
     slug = resort_href.replace('/our-resorts/', '').replace('/', '')
     page_html = get_page_html(url, read_mode=read_mode)
+    output_file = f'{output_dir}/{slug}.json'
+
+    # Skip the parse if this exact page was already parsed (by this parser) into output_file.
+    # The sidecar next to the cached HTML records the digest of the parse inputs and of the
+    # extract it wrote; the extract is tracked in git, so a checkout may have replaced it since.
+    digest_file = f'{CACHE_DIRECTORY}{slug}.parsed.json'
+    hasher = hashlib.blake2b(_PARSER_DIGEST, digest_size=16)
+    hasher.update(f'{resort_id}\0{slug}\0'.encode('utf-8'))
+    hasher.update(page_html.encode('utf-8'))
+    input_digest = hasher.hexdigest()
+    try:
+        with open(digest_file, 'r', encoding='utf-8') as f:
+            recorded = json.load(f)
+        with open(output_file, 'rb') as f:
+            extract = f.read()
+    except (FileNotFoundError, json.JSONDecodeError):
+        recorded = {}
+    if recorded.get('input') == input_digest and recorded.get('extract') == (
+        hashlib.blake2b(extract, digest_size=16).hexdigest()
+    ):
+        resort_dict = json.loads(extract)
+        logger.info('Resort page unchanged since last parse: "%s"', resort_dict["name"])
+        return resort_dict
+
     resort_dict = parse_resort_page(page_html, resort_id=resort_id, resort_slug=slug)
-    with open(f'{output_dir}/{slug}.json', 'w', encoding='utf-8') as f:
-        json.dump(resort_dict, f, indent=4)
+    extract = json.dumps(resort_dict, indent=4).encode('utf-8')
+    with open(output_file, 'wb') as f:
+        f.write(extract)
+    with open(digest_file, 'w', encoding='utf-8') as f:
+        json.dump(
+            {
+                'input': input_digest,
+                'extract': hashlib.blake2b(extract, digest_size=16).hexdigest(),
+            },
+            f,
+        )
     logger.info('Parsed resort: "%s"', resort_dict["name"])
     return resort_dict
 
@@ -425,11 +534,16 @@ def main() -> None:
     our_resorts_html = cache_our_resorts_page(read_mode=args.read_mode)
     resorts = parse_and_save_our_resorts(our_resorts_html)
 
-    # 2. Iterate over all resorts and retrieve resort details
-    for _id, resort in resorts.items():
-        cache_and_parse_resort(_id, resort["href"], read_mode=args.read_mode)
-        if args.read_mode == 'live':
-            time.sleep(0.5)
+    # 2. Retrieve resort details for all resorts (live fetches are paced in get_page_html)
+    with ThreadPoolExecutor(max_workers=SCRAPE_MAX_WORKERS) as executor:
+        list(
+            executor.map(
+                lambda item: cache_and_parse_resort(
+                    item[0], item[1]["href"], read_mode=args.read_mode
+                ),
+                resorts.items(),
+            )
+        )
 
 
 if __name__ == '__main__':
@@ -13,7 +13,7 @@ import logging
 import os
 import shutil
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -66,6 +66,7 @@ def step_scrape_resorts(full: bool) -> None:
     - Full: delete all cached resort HTML and re-scrape everything.
     """
     from page_scraper import (
+        SCRAPE_MAX_WORKERS,
         cache_our_resorts_page,
         parse_and_save_our_resorts,
         cache_and_parse_resort,
@@ -89,23 +90,29 @@ def step_scrape_resorts(full: bool) -> None:
     resorts = parse_and_save_our_resorts(our_resorts_html)
     logger.info('Found %d resorts on main page.', len(resorts))
 
-    # Scrape individual resort pages
-    new_count = 0
-    cached_count = 0
-    for i, (_id, resort) in enumerate(resorts.items(), 1):
+    # Scrape individual resort pages a few at a time. Live fetches are paced inside
+    # page_scraper (at most one request every 0.5s) to be polite to Indy's servers.
+    def _scrape_resort(i: int, _id: str, resort: dict) -> str:
         slug = resort['href'].split('/')[-1]
         cache_file = CACHE_DIR / f'{slug}.html'
 
         if not full and cache_file.exists():
             # Use cached HTML — no HTTP request
             cache_and_parse_resort(_id, resort['href'], read_mode='cache')
-            cached_count += 1
-        else:
-            # Fetch live (new resort or full refresh)
-            logger.info('  [%d/%d] Fetching: %s', i, len(resorts), resort.get('name', slug))
-            cache_and_parse_resort(_id, resort['href'], read_mode='live')
-            new_count += 1
-            time.sleep(0.5)  # be polite to Indy's servers
+            return 'cache'
+        # Fetch live (new resort or full refresh)
+        logger.info('  [%d/%d] Fetching: %s', i, len(resorts), resort.get('name', slug))
+        cache_and_parse_resort(_id, resort['href'], read_mode='live')
+        return 'live'
+
+    with ThreadPoolExecutor(max_workers=SCRAPE_MAX_WORKERS) as executor:
+        modes = list(
+            executor.map(
+                lambda item: _scrape_resort(item[0], *item[1]), enumerate(resorts.items(), 1)
+            )
+        )
+    cached_count = modes.count('cache')
+    new_count = modes.count('live')
 
     logger.info(
         'Resort scraping complete: %d from cache, %d fetched live.', cached_count, new_count
@@ -40,15 +40,15 @@ def assign_resort_ids(resorts: pd.DataFrame) -> pd.DataFrame:
     """Assign stable UUID resort_ids using the id map, generating new ones for new resorts."""
     try:
         id_map = pd.read_csv(ID_MAP_PATH)
-        existing = dict(zip(zip(id_map['source'], id_map['source_id']), id_map['resort_id']))
     except FileNotFoundError:
-        existing = {}
+        id_map = pd.DataFrame(columns=['resort_id', 'source', 'source_id'])
+    existing = dict(zip(zip(id_map['source'], id_map['source_id']), id_map['resort_id']))
 
+    slugs = resorts['indy_page'].astype(str).str.rstrip('/').str.split('/').str[-1]
     new_rows = []
     resort_ids = []
 
-    for _, row in resorts.iterrows():
-        slug = str(row.get('indy_page', '')).rstrip('/').split('/')[-1]
+    for slug, name in zip(slugs, resorts['name']):
         key = ('indy', slug)
         if key in existing:
             resort_ids.append(existing[key])
@@ -56,16 +56,14 @@ def assign_resort_ids(resorts: pd.DataFrame) -> pd.DataFrame:
             new_id = str(uuid.uuid4())
             resort_ids.append(new_id)
             new_rows.append({'resort_id': new_id, 'source': 'indy', 'source_id': slug})
-            logger.info('Generated new resort_id for %s (%s)', row.get('name', ''), slug)
+            logger.info('Generated new resort_id for %s (%s)', name, slug)
 
-    resorts = resorts.copy()
+    # Shallow copy: inserting a column must not touch the caller's frame, but there's
+    # no need to duplicate every column's data to get that
+    resorts = resorts.copy(deep=False)
     resorts.insert(0, 'resort_id', resort_ids)
 
     if new_rows:
-        try:
-            id_map = pd.read_csv(ID_MAP_PATH)
-        except FileNotFoundError:
-            id_map = pd.DataFrame(columns=['resort_id', 'source', 'source_id'])
         id_map = pd.concat([id_map, pd.DataFrame(new_rows)], ignore_index=True)
         id_map.to_csv(ID_MAP_PATH, index=False)
         logger.info('Wrote %d new entries to %s', len(new_rows), ID_MAP_PATH)
@@ -81,13 +79,13 @@ def get_regions_from_location_name(location_name: str) -> Tuple[str, str, str]:
     return location_json['city'], location_json['state'], location_json['country']
 
 
-def is_alpine(resort):
-    """Determine if the resort is an alpine resort"""
-    if (not resort.is_nordic) and (not resort.is_alpine_xc) and (not resort.is_xc_only):
-        return True
-    if resort.is_alpine_xc:
-        return True
-    return False
+def is_alpine(resorts: pd.DataFrame) -> pd.Series:
+    """Determine which resorts are alpine resorts: alpine/XC, or not nordic/XC-only at all"""
+    # astype(bool) keeps the truthiness the old per-row `not resort.is_nordic` checks used
+    nordic = resorts['is_nordic'].astype(bool)
+    alpine_xc = resorts['is_alpine_xc'].astype(bool)
+    xc_only = resorts['is_xc_only'].astype(bool)
+    return alpine_xc | ~(nordic | xc_only)
 
 
 def main(refresh_blackout=False, refresh_ltt=False):
@@ -124,12 +122,11 @@ def main(refresh_blackout=False, refresh_ltt=False):
     logger.debug('Resorts DataFrame rows: %d.', len(resorts))
 
     # Webpage URL
-    resorts['indy_page'] = resorts['href'].apply(
-        lambda x: 'https://www.indyskipass.com' + x if x else 'n/a'
-    )
+    href = resorts['href'].fillna('')
+    resorts['indy_page'] = ('https://www.indyskipass.com' + href).where(href != '', 'n/a')
 
     # Separate the resort type labels
-    resorts['has_alpine'] = resorts.apply(is_alpine, axis=1)
+    resorts['has_alpine'] = is_alpine(resorts)
     resorts['has_cross_country'] = resorts['is_nordic']
 
     # Fix discrepancies between main page and resort page
@@ -153,8 +150,9 @@ def main(refresh_blackout=False, refresh_ltt=False):
     resorts.rename(columns={'trails_xc': 'num_trails_xc'}, inplace=True)
 
     # Location
-    resorts['longitude'] = resorts['coordinates'].apply(lambda l: l.get('longitude') if l else None)
-    resorts['latitude'] = resorts['coordinates'].apply(lambda l: l.get('latitude') if l else None)
+    coordinates = resorts['coordinates'].str
+    resorts['longitude'] = coordinates.get('longitude')
+    resorts['latitude'] = coordinates.get('latitude')
     # resorts['city'], resorts['state'], resorts['country'] = zip(*resorts.location_name.apply(get_regions_from_location_name))
     resorts = pd.merge(resorts, locations, left_on='name', right_on='name', how='left')
     missing_locations = resorts['city'].isna().sum()
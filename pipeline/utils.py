@@ -1,28 +1,80 @@
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
 import os
 import json
 import logging
+import threading
+import time
 from typing import Optional, Dict
 
 from dotenv import load_dotenv
-import googlemaps
-import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 API_KEY: Optional[str] = os.getenv("GOOGLE_MAPS_API_KEY")
-# Initialize client lazily and safely: if no API key is provided (e.g., in CI), don't
-# attempt to create a googlemaps.Client at import time which raises ValueError.
+# The googlemaps client (and the googlemaps import itself) is created on first use by
+# _get_gmaps(), so modules that only need the date/HTTP helpers here start up quickly.
+# Without an API key (e.g., in CI) it stays None; tests monkeypatch `gmaps`.
 gmaps = None
-if API_KEY:
-    try:
-        gmaps = googlemaps.Client(key=API_KEY)
-    except Exception as e:
-        # Fail gracefully in environments without an API key; tests will monkeypatch `gmaps`.
-        logger.warning("Could not initialize googlemaps client: %s", e)
-        gmaps = None
+_gmaps_lock = threading.Lock()
+
+# Geocoding is network-bound, so lookups run on a small thread pool. Requests are paced to
+# stay comfortably under Google's 50 QPS Geocoding API limit.
+GEOCODE_MAX_WORKERS = 10
+GEOCODE_MAX_QPS = 40
+
+
+class RequestPacer:
+    """Spaces out request starts, across threads, to at most one every `interval` seconds."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        """Block until the calling thread may send its request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_geocode_pacer = RequestPacer(1 / GEOCODE_MAX_QPS)
+
+
+def _get_gmaps():
+    """Return the shared googlemaps client, creating it on first use if an API key is set."""
+    global gmaps
+    with _gmaps_lock:
+        if gmaps is None and API_KEY:
+            import googlemaps
+
+            # Size the client's keep-alive pool for the geocoding thread pool so workers don't
+            # queue for connections; the client also backs off on OVER_QUERY_LIMIT itself.
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=GEOCODE_MAX_WORKERS, pool_maxsize=GEOCODE_MAX_WORKERS
+            )
+            session.mount('https://', adapter)
+            try:
+                gmaps = googlemaps.Client(
+                    key=API_KEY,
+                    requests_session=session,
+                    retry_over_query_limit=True,
+                    queries_per_second=GEOCODE_MAX_QPS,
+                )
+            except Exception as e:
+                # Fail gracefully; geocoding then logs a warning per location
+                logger.warning("Could not initialize googlemaps client: %s", e)
+        return gmaps
 
 
 def get_normalized_location(location_name: str) -> Dict[str, Optional[str]]:
@@ -40,7 +92,8 @@ def get_normalized_location(location_name: str) -> Dict[str, Optional[str]]:
     country: Optional[str] = None
 
     try:
-        geocode_result = gmaps.geocode(location_name)
+        _geocode_pacer.wait()
+        geocode_result = _get_gmaps().geocode(location_name)
         if not geocode_result:
             return {"city": city, "state": state, "country": country}
 
@@ -74,6 +127,8 @@ def generate_resort_locations_csv(
     name) are left as-is and not re-geocoded. Pass full=True to re-geocode every
     resort and overwrite the existing cache.
     """
+    # Imported here so the lightweight helpers in this module don't pay for pandas
+    import pandas as pd
 
     # Load resorts data
     with open(resorts_json_path, 'r', encoding='utf-8') as f:
@@ -87,33 +142,42 @@ def generate_resort_locations_csv(
         if name and location_name:
             locations.append((name, location_name))
 
-    # Remove duplicates
-    unique_locations = list({(n, l) for n, l in locations})
+    # Remove duplicates, keeping first-seen order so reruns append rows in a stable order
+    unique_locations = list(dict.fromkeys(locations))
 
-    existing_df = pd.DataFrame(columns=['name', 'city', 'state', 'country'])
+    columns = ['name', 'city', 'state', 'country']
+    existing_df = pd.DataFrame(columns=columns)
     cached_names = set()
     if not full and os.path.exists(output_csv_path):
         existing_df = pd.read_csv(output_csv_path)
         cached_names = set(existing_df['name'])
 
-    # Fetch normalized locations for anything not already cached
-    new_rows = []
-    for name, location_name in unique_locations:
-        if name in cached_names:
-            continue
+    # Fetch normalized locations for anything not already cached, several at a time.
+    # Resorts often share a location (e.g. several hills around one town), so each distinct
+    # location_name is geocoded once per run and the result reused for every resort there.
+    pending = [(n, l) for n, l in unique_locations if n not in cached_names]
+    pending_locations = list(dict.fromkeys(l for _, l in pending))
+    for name, location_name in pending:
         logger.info("Retrieving location for: %s / %s", name, location_name)
-        loc = get_normalized_location(location_name)
-        new_rows.append(
-            {
-                'name': name,
-                'city': loc.get('city'),
-                'state': loc.get('state'),
-                'country': loc.get('country'),
-            }
+    with ThreadPoolExecutor(max_workers=GEOCODE_MAX_WORKERS) as executor:
+        geocoded = dict(
+            zip(pending_locations, executor.map(get_normalized_location, pending_locations))
+        )
+
+    # Plain row tuples against a fixed column list, rather than per-row dicts whose keys
+    # pandas has to scan and union to work out the columns
+    new_rows = [
+        (
+            name,
+            geocoded[location_name].get('city'),
+            geocoded[location_name].get('state'),
+            geocoded[location_name].get('country'),
         )
+        for name, location_name in pending
+    ]
 
     df = (
-        pd.concat([existing_df, pd.DataFrame(new_rows)], ignore_index=True)
+        pd.concat([existing_df, pd.DataFrame(new_rows, columns=columns)], ignore_index=True)
         if new_rows
         else existing_df
     )
@@ -126,6 +190,7 @@ def generate_resort_locations_csv(
 # Date Utilities
 
 
+@lru_cache(maxsize=4096)
 def split_date_range(date_range: str) -> tuple[str, str]:
     """
     Splits a date range string formatted as "Jan 1 - Mar 31" into start and end dates.
@@ -163,6 +228,7 @@ def split_date_range(date_range: str) -> tuple[str, str]:
     return start_date, end_date
 
 
+@lru_cache(maxsize=4096)
 def convert_date_string_format(date_string: str):
     """
     Converts a date formatted as Jan 1 to YYYY-MM-DD
@@ -183,11 +249,10 @@ def get_all_dates_in_range(start_date: str, end_date: str) -> list[str]:
     """
     Given a start date and end date in YYYY-MM-DD format, returns a list of all dates in that range (inclusive).
     """
-    start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-    end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-    delta = end_dt - start_dt
-
-    return [(start_dt + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(delta.days + 1)]
+    # Step through day ordinals rather than strptime/strftime-ing every date
+    start = date.fromisoformat(start_date).toordinal()
+    end = date.fromisoformat(end_date).toordinal()
+    return [date.fromordinal(n).isoformat() for n in range(start, end + 1)]
 
 
 def filter_dates_for_weekday(dates: list[str], weekday: int) -> list[str]:
@@ -195,9 +260,74 @@ def filter_dates_for_weekday(dates: list[str], weekday: int) -> list[str]:
     Given a list of dates in YYYY-MM-DD format, returns a list of dates that fall on the given weekday.
     Weekday is an integer where Monday is 0 and Sunday is 6.
     """
-    filtered_dates = []
-    for date_str in dates:
-        date_dt = datetime.strptime(date_str, '%Y-%m-%d')
-        if date_dt.weekday() == weekday:
-            filtered_dates.append(date_str)
-    return filtered_dates
+    return [d for d in dates if date.fromisoformat(d).weekday() == weekday]
+
+
+# HTTP Utilities
+
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Shared requests session, so repeated fetches reuse pooled keep-alive connections.
+
+    Safe to call from worker threads; connection errors are retried a few times.
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            _http_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=3)
+            _http_session.mount('https://', adapter)
+            _http_session.mount('http://', adapter)
+        return _http_session
+
+
+def fetch_text_if_modified(
+    url: str, cache_path: str, encoding: str = 'utf-8', timeout: float = 30
+) -> str:
+    """
+    GET `url`, revalidating the copy at `cache_path` with ETag/Last-Modified validators.
+
+    Validators from the last successful fetch live in a `<cache_path>.meta.json` sidecar.
+    On 304 Not Modified the cached text is returned without re-downloading; otherwise the
+    new body is written to `cache_path` and returned. The body is decoded as `encoding`
+    whatever charset the response headers claim: Google Sheets CSV exports are UTF-8 even
+    when served without one, and the cached copy is read back as UTF-8.
+    """
+    meta_path = f'{cache_path}.meta.json'
+    headers = {}
+    if os.path.exists(cache_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                validators = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            validators = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+    response = get_http_session().get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        logger.info('Not modified since last fetch; using cached copy at %s', cache_path)
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    response.raise_for_status()
+
+    response.encoding = encoding
+    text = response.text
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(
+            {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            },
+            f,
+        )
+    return text
@@ -1,7 +1,9 @@
 import json
 import pandas as pd
 
+import blackout
 from blackout import (
+    get_blackout_dates_from_google_sheets,
     normalize_additional_dates,
     parse_blackout_sheet,
     merge_blackout_into_resorts,
@@ -54,6 +56,41 @@ def test_normalize_additional_dates():
     assert out6 == []
 
 
+def _sheet_with_blank_header_and_extra_column() -> str:
+    """The fixture sheet as Sheets exports it: blank resort header, plus an unparsed column."""
+    with open("tests/fixtures/blackout_sheet.csv", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    header = lines[0].replace('"Resort"', '" "', 1) + ',"Notes"'
+    rows = [line + ',"X"' for line in lines[1:]]
+    return "\n".join([header, *rows]) + "\n"
+
+
+def test_get_blackout_dates_from_google_sheets_keeps_raw_sheet(tmp_path, monkeypatch):
+    csv_text = _sheet_with_blank_header_and_extra_column()
+    monkeypatch.setattr(blackout, "fetch_text_if_modified", lambda url, cache_path: csv_text)
+    cache_path = tmp_path / "blackout_dates_raw.csv"
+    cache_path.write_text(csv_text, encoding="utf-8")
+
+    live_df = get_blackout_dates_from_google_sheets(sheet_url="https://example.com/sheet.csv")
+    cached_df = get_blackout_dates_from_google_sheets(read_mode="cache", cache_path=str(cache_path))
+    pd.testing.assert_frame_equal(live_df, cached_df)
+
+    # The snapshot keeps the sheet's own headers and every column, including the blank
+    # resort header and columns the parser doesn't read
+    assert list(live_df.columns) == [
+        " ",
+        "Peak Saturdays\\nDec 6 - Dec 13",
+        "Peak Sundays\\nDec 7 - Dec 14",
+        "Additional Blackout Dates",
+        "Notes",
+    ]
+
+    # Parsing ignores the extra column and handles the escaped named-range headers
+    expected = parse_blackout_sheet(pd.read_csv("tests/fixtures/blackout_sheet.csv"))
+    assert parse_blackout_sheet(live_df) == expected
+    assert expected["Resort A"]["named_ranges"] == ["Peak Saturdays"]
+
+
 def test_parse_blackout_sheet_and_merge(tmp_path):
     csv_path = "tests/fixtures/blackout_sheet.csv"
     df = pd.read_csv(csv_path)
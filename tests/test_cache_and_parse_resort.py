@@ -0,0 +1,77 @@
+import json
+import os
+import shutil
+
+import page_scraper
+from page_scraper import cache_and_parse_resort
+
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "powder_ridge_fixture.html")
+
+
+def _setup(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("cache")
+    os.makedirs("extracts")
+    shutil.copy(FIXTURE, "cache/powder-ridge.html")
+
+
+def test_unchanged_page_is_not_reparsed(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+    first = cache_and_parse_resort(
+        "123", "/our-resorts/powder-ridge", read_mode="cache", output_dir="extracts"
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("page should not be re-parsed")
+
+    monkeypatch.setattr(page_scraper, "parse_resort_page", fail)
+    second = cache_and_parse_resort(
+        "123", "/our-resorts/powder-ridge", read_mode="cache", output_dir="extracts"
+    )
+    assert second == first
+    with open("extracts/powder-ridge.json", encoding="utf-8") as f:
+        assert json.load(f) == first
+
+
+def test_changed_page_is_reparsed(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+    cache_and_parse_resort(
+        "123", "/our-resorts/powder-ridge", read_mode="cache", output_dir="extracts"
+    )
+
+    with open("cache/powder-ridge.html", encoding="utf-8") as f:
+        html = f.read()
+    with open("cache/powder-ridge.html", "w", encoding="utf-8") as f:
+        f.write(html.replace("Powder Ridge", "Powder Ridge Park"))
+
+    result = cache_and_parse_resort(
+        "123", "/our-resorts/powder-ridge", read_mode="cache", output_dir="extracts"
+    )
+    assert result["name"] == "Powder Ridge Park"
+
+    # A missing extract is regenerated even though the page itself is unchanged
+    os.remove("extracts/powder-ridge.json")
+    result = cache_and_parse_resort(
+        "123", "/our-resorts/powder-ridge", read_mode="cache", output_dir="extracts"
+    )
+    assert result["name"] == "Powder Ridge Park"
+    assert os.path.exists("extracts/powder-ridge.json")
+
+
+def test_replaced_extract_is_reparsed(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+    first = cache_and_parse_resort(
+        "123", "/our-resorts/powder-ridge", read_mode="cache", output_dir="extracts"
+    )
+
+    # e.g. a git checkout swapped in a different extract for the same cached page
+    with open("extracts/powder-ridge.json", "w", encoding="utf-8") as f:
+        json.dump(dict(first, name="Stale Name"), f, indent=4)
+
+    result = cache_and_parse_resort(
+        "123", "/our-resorts/powder-ridge", read_mode="cache", output_dir="extracts"
+    )
+    assert result == first
+    with open("extracts/powder-ridge.json", encoding="utf-8") as f:
+        assert json.load(f) == first
@@ -0,0 +1,64 @@
+import json
+
+import utils
+
+
+class _FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = None
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'latin-1')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f'HTTP {self.status_code}')
+
+
+class _FakeSession:
+    """Returns queued responses and records the request headers it was sent."""
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(headers or {})
+        return self._responses.pop(0)
+
+
+def test_fetch_text_if_modified_caches_body_and_validators(tmp_path, monkeypatch):
+    cache_path = tmp_path / 'sheet.csv'
+    session = _FakeSession(
+        _FakeResponse(
+            200, '49° North,X\n'.encode('utf-8'), {'ETag': '"v1"', 'Last-Modified': 'Mon'}
+        )
+    )
+    monkeypatch.setattr(utils, 'get_http_session', lambda: session)
+
+    text = utils.fetch_text_if_modified('https://example.com', str(cache_path))
+
+    assert text == '49° North,X\n'
+    assert session.sent_headers == [{}]
+    assert cache_path.read_text(encoding='utf-8') == text
+    meta = json.loads((tmp_path / 'sheet.csv.meta.json').read_text())
+    assert meta == {'etag': '"v1"', 'last_modified': 'Mon'}
+
+
+def test_fetch_text_if_modified_returns_cache_on_304(tmp_path, monkeypatch):
+    cache_path = tmp_path / 'sheet.csv'
+    cache_path.write_text('cached body', encoding='utf-8')
+    (tmp_path / 'sheet.csv.meta.json').write_text(
+        json.dumps({'etag': '"v1"', 'last_modified': None})
+    )
+    session = _FakeSession(_FakeResponse(304))
+    monkeypatch.setattr(utils, 'get_http_session', lambda: session)
+
+    text = utils.fetch_text_if_modified('https://example.com', str(cache_path))
+
+    assert text == 'cached body'
+    assert session.sent_headers == [{'If-None-Match': '"v1"'}]
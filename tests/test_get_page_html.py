@@ -0,0 +1,79 @@
+import os
+
+import pytest
+import requests
+
+import page_scraper
+from page_scraper import get_page_html
+
+
+class _FakeStreamedResponse:
+    """Streams `chunks` from iter_content; an exception in `chunks` is raised mid-stream."""
+
+    def __init__(self, chunks, encoding=None):
+        self._chunks = chunks
+        self.encoding = encoding
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        for chunk in self._chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+
+class _FakeSession:
+    def __init__(self, response):
+        self._response = response
+
+    def get(self, url, timeout=None, stream=False):
+        return self._response
+
+
+def _serve(monkeypatch, response):
+    monkeypatch.setattr(page_scraper, 'get_http_session', lambda: _FakeSession(response))
+    monkeypatch.setattr(page_scraper, '_live_request_pacer', page_scraper.RequestPacer(0))
+
+
+def test_live_fetch_caches_page(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _serve(monkeypatch, _FakeStreamedResponse([b'<html>Powder ', b'Ridge</html>']))
+
+    html = get_page_html('https://example.com/our-resorts/powder-ridge', 'live')
+
+    assert html == '<html>Powder Ridge</html>'
+    assert get_page_html('https://example.com/our-resorts/powder-ridge', 'cache') == html
+    assert os.listdir('cache') == ['powder-ridge.html']
+
+
+def test_live_and_cache_reads_agree_without_charset(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    body = '<html>Château 49° North</html>'.encode('utf-8')
+    # requests reports ISO-8859-1 for text/html served without a charset
+    _serve(monkeypatch, _FakeStreamedResponse([body], encoding='ISO-8859-1'))
+
+    html = get_page_html('https://example.com/our-resorts/chateau', 'live')
+
+    assert html == '<html>Château 49° North</html>'
+    assert get_page_html('https://example.com/our-resorts/chateau', 'cache') == html
+
+
+def test_failed_stream_leaves_no_cache_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _serve(
+        monkeypatch,
+        _FakeStreamedResponse([b'<html>Powder', requests.exceptions.ChunkedEncodingError()]),
+    )
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        get_page_html('https://example.com/our-resorts/powder-ridge', 'live')
+
+    assert os.listdir('cache') == []
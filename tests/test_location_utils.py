@@ -146,3 +146,44 @@ def test_generate_resort_locations_csv_full_regenerates_all(tmp_path, monkeypatc
     assert client.calls == ["Townsville, ST"]
     df = pd.read_csv(output_csv)
     assert df.set_index("name").loc["Resort A", "city"] == "Townsville"
+
+
+def test_generate_resort_locations_csv_geocodes_concurrently_once_each(tmp_path, monkeypatch):
+    resorts_json = tmp_path / "resorts_raw.json"
+    output_csv = tmp_path / "resort_locations.csv"
+    entries = [(f"Resort {i}", f"Town {i}, ST") for i in range(25)]
+    _write_resorts_json(resorts_json, entries)
+
+    client = _CountingGMClient(_GEOCODE_RESPONSE)
+    monkeypatch.setattr(location_utils, "gmaps", client)
+    monkeypatch.setattr(location_utils, "_geocode_pacer", location_utils.RequestPacer(0))
+
+    location_utils.generate_resort_locations_csv(str(resorts_json), str(output_csv))
+
+    assert sorted(client.calls) == sorted(loc for _, loc in entries)
+    df = pd.read_csv(output_csv)
+    assert sorted(df["name"]) == sorted(name for name, _ in entries)
+    assert (df["city"] == "Townsville").all()
+
+
+def test_generate_resort_locations_csv_geocodes_shared_location_once(tmp_path, monkeypatch):
+    resorts_json = tmp_path / "resorts_raw.json"
+    output_csv = tmp_path / "resort_locations.csv"
+    _write_resorts_json(
+        resorts_json,
+        [
+            ("Resort A", "Townsville, ST"),
+            ("Resort B", "Townsville, ST"),
+            ("Resort C", "Cityville, ST"),
+        ],
+    )
+
+    client = _CountingGMClient(_GEOCODE_RESPONSE)
+    monkeypatch.setattr(location_utils, "gmaps", client)
+
+    location_utils.generate_resort_locations_csv(str(resorts_json), str(output_csv))
+
+    assert sorted(client.calls) == ["Cityville, ST", "Townsville, ST"]
+    df = pd.read_csv(output_csv)
+    assert set(df["name"]) == {"Resort A", "Resort B", "Resort C"}
+    assert (df["city"] == "Townsville").all()
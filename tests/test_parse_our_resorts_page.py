@@ -0,0 +1,129 @@
+import json
+import logging
+import os
+
+import pytest
+
+from page_scraper import (
+    parse_and_save_our_resorts,
+    parse_lat_long,
+    parse_our_resorts_page,
+    parse_vertical,
+)
+
+
+def load_fixture(name: str) -> str:
+    path = os.path.join(os.path.dirname(__file__), "fixtures", name)
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_parse_our_resorts_page_cards():
+    resorts = parse_our_resorts_page(load_fixture("our_resorts_fixture.html"))
+
+    # Only the cards inside #main-content are parsed, not the nav/footer spans
+    assert list(resorts) == ["101", "102"]
+
+    powder_ridge = resorts["101"]
+    assert powder_ridge["name"] == "Powder Ridge"
+    assert powder_ridge["location_name"] == "Middlefield, CT, USA"
+    assert powder_ridge["href"] == "/our-resorts/powder-ridge"
+    assert powder_ridge["coordinates"] == {"latitude": 41.5037, "longitude": -72.7523}
+    assert powder_ridge["vertical"] == 500
+    assert powder_ridge["num_trails"] == 22
+    assert powder_ridge["num_lifts"] == 5
+    assert powder_ridge["is_open_nights"] is True
+    assert powder_ridge["has_terrain_parks"] is True
+    assert powder_ridge["is_nordic"] is False
+
+    nordic_hollow = resorts["102"]
+    assert nordic_hollow["vertical"] is None
+    assert nordic_hollow["num_trails"] is None
+    assert nordic_hollow["num_lifts"] is None
+    assert nordic_hollow["is_open_nights"] is False
+    assert nordic_hollow["is_nordic"] is True
+    assert nordic_hollow["is_xc_only"] is True
+
+
+def test_parse_and_save_our_resorts_writes_json(tmp_path):
+    output_path = tmp_path / "resorts_raw.json"
+
+    resorts = parse_and_save_our_resorts(
+        load_fixture("our_resorts_fixture.html"), output_path=output_path
+    )
+
+    with open(output_path, encoding="utf-8") as f:
+        assert json.load(f) == resorts
+
+
+def test_parse_our_resorts_page_card_without_stats(caplog):
+    html = """
+    <html><body><main id="main-content">
+      <a class="node node--type-resort" href="/our-resorts/tiny-hill" data-history-node-id="7"
+         data-location="POINT (-70.0 44.0)">
+        <span class="label">Tiny Hill</span><span class="location">Somewhere, ME</span>
+        <ul><li><span class="value">300ft</span></li></ul>
+      </a>
+    </main></body></html>
+    """
+
+    resorts = parse_our_resorts_page(html)
+
+    assert resorts["7"]["vertical"] == 300
+    assert resorts["7"]["num_trails"] is None
+    assert resorts["7"]["num_lifts"] is None
+    assert resorts["7"]["is_open_nights"] is None
+    assert resorts["7"]["has_terrain_parks"] is None
+
+    # All of the card's missing fields are reported together in one warning
+    warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+    assert warnings == [
+        "Could not get trails, lifts, open_nights, terrain_parks, is_nordic, is_alpine_xc, "
+        "is_xc_only, is_allied for resort ID: 7"
+    ]
+
+
+def test_parse_our_resorts_page_ignores_other_lists():
+    html = """
+    <html><body><main id="main-content">
+      <a class="node node--type-resort" href="/our-resorts/tag-hill" data-history-node-id="8"
+         data-location="POINT (-70.0 44.0)">
+        <ul class="tags"><li>Family</li><li>New</li></ul>
+        <span class="label">Tag Hill</span><span class="location">Somewhere, VT</span>
+        <ul>
+          <li><span class="value">1,000ft</span></li>
+          <li><span class="value">40</span></li>
+          <li><span class="value">6</span></li>
+          <li><span class="value">No</span></li>
+          <li><span class="value">Yes</span></li>
+        </ul>
+      </a>
+    </main></body></html>
+    """
+
+    resort = parse_our_resorts_page(html)["8"]
+
+    assert resort["vertical"] == 1000
+    assert resort["num_trails"] == 40
+    assert resort["num_lifts"] == 6
+    assert resort["is_open_nights"] is False
+    assert resort["has_terrain_parks"] is True
+
+
+def test_parse_vertical():
+    assert parse_vertical("2100ft") == 2100
+    assert parse_vertical("2,100 ft") == 2100
+    assert parse_vertical(" 500ft ") == 500
+    assert parse_vertical("- -") is None
+    with pytest.raises(ValueError):
+        parse_vertical("lots ft")
+
+
+def test_parse_lat_long():
+    assert parse_lat_long("POINT (-72.7523 41.5037)") == {
+        "latitude": 41.5037,
+        "longitude": -72.7523,
+    }
+    assert parse_lat_long("POINT (139.5 -35.25)") == {"latitude": -35.25, "longitude": 139.5}
+    with pytest.raises(ValueError):
+        parse_lat_long("-72.7523, 41.5037")